@@ -0,0 +1,83 @@
+"""Compara el árbol AVL de punteros contra el de arreglos.
+
+Mide memoria por nodo, tiempo de carga masiva, inserciones/eliminaciones
+aleatorias y consultas de rango sobre el mismo conjunto de obstáculos.
+
+Uso: python -m benchmarks.arboles [cantidad]
+"""
+import contextlib
+import io
+import random
+import sys
+import time
+import tracemalloc
+
+from game.obstaculo import Obstaculo
+from game.motor import ARBOLES_OBSTACULOS
+
+
+def crear_obstaculos(cantidad, semilla=0):
+    aleatorio = random.Random(semilla)
+    tipos = ("roca", "cono", "hueco", "aceite")
+    obstaculos = []
+    for i in range(cantidad):
+        obstaculo = Obstaculo(0, 0, aleatorio.choice(tipos))
+        obstaculo.x_original = i * 7
+        obstaculo.y_original = aleatorio.randint(0, 2)
+        obstaculos.append(obstaculo)
+    aleatorio.shuffle(obstaculos)
+    return obstaculos
+
+
+def medir(nombre, clase_arbol, obstaculos):
+    tracemalloc.start()
+    arbol = clase_arbol()
+    arbol.construir_desde(obstaculos)
+    memoria = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    # Se reconstruye sin tracemalloc para que el tiempo no incluya su sobrecosto
+    arbol = clase_arbol()
+    inicio = time.perf_counter()
+    arbol.construir_desde(obstaculos)
+    tiempo_carga = time.perf_counter() - inicio
+
+    aleatorio = random.Random(1)
+    claves = [(o.x_original, o.y_original) for o in aleatorio.sample(obstaculos, min(20000, len(obstaculos)))]
+    inicio = time.perf_counter()
+    for x, y in claves:
+        arbol.eliminar_nodo(x, y)
+    tiempo_eliminar = time.perf_counter() - inicio
+
+    nuevos = crear_obstaculos(len(claves), semilla=2)
+    for obstaculo in nuevos:
+        obstaculo.x_original += 3
+    inicio = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        for obstaculo in nuevos:
+            arbol.insertar_obstaculo(obstaculo)
+    tiempo_insertar = time.perf_counter() - inicio
+
+    limite = len(obstaculos) * 7
+    inicio = time.perf_counter()
+    visitados = 0
+    for _ in range(2000):
+        x_min = aleatorio.uniform(0, limite)
+        visitados += sum(1 for _ in arbol.rango(x_min, x_min + 1000))
+    tiempo_rango = time.perf_counter() - inicio
+
+    print(f"{nombre:>9}: {memoria / len(obstaculos):6.1f} bytes/nodo | carga {tiempo_carga * 1000:8.1f} ms | "
+          f"{len(claves)} eliminar {tiempo_eliminar * 1000:7.1f} ms | {len(nuevos)} insertar {tiempo_insertar * 1000:7.1f} ms | "
+          f"2000 rangos ({visitados} nodos) {tiempo_rango * 1000:7.1f} ms")
+
+
+def main():
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    obstaculos = crear_obstaculos(cantidad)
+    print(f"Obstáculos: {cantidad}")
+    for nombre, clase_arbol in ARBOLES_OBSTACULOS.items():
+        medir(nombre, clase_arbol, obstaculos)
+
+
+if __name__ == "__main__":
+    main()
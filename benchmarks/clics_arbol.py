@@ -0,0 +1,63 @@
+"""Compara la búsqueda del nodo bajo un clic: recorrido lineal contra RejillaNodos.
+
+El recorrido lineal es el que hacía manejar_click_eliminacion: calcular la
+distancia a cada nodo y quedarse con el primero dentro del radio. La rejilla
+se arma una vez por disposición y se mide aparte.
+
+Uso: python -m benchmarks.clics_arbol
+"""
+import math
+import random
+import time
+
+from benchmarks.visualizador import construir
+from game.disposicion_arbol import DisposicionArbol
+from game.rejilla_nodos import RejillaNodos
+
+CLICS = 200
+RADIO = 50
+TAMAÑOS = (1000, 10000, 100000)
+
+
+def lineal(posiciones, x, y):
+    for nodo, (nodo_x, nodo_y) in posiciones.items():
+        if math.sqrt((x - nodo_x) ** 2 + (y - nodo_y) ** 2) <= RADIO:
+            return nodo
+    return None
+
+
+def medir(cantidad):
+    arbol = construir(cantidad)
+    disposicion = DisposicionArbol()
+    disposicion.acomodar(arbol.raiz)
+    posiciones = disposicion.ubicar(arbol.raiz, 500.0, 60, 70, 80)
+    # Clics cerca de nodos al azar
+    aleatorio = random.Random(0)
+    clics = [(x + aleatorio.uniform(-40, 40), y + aleatorio.uniform(-40, 40))
+             for x, y in aleatorio.sample(list(posiciones.values()), CLICS)]
+
+    inicio = time.perf_counter()
+    rejilla = RejillaNodos(posiciones, 80)
+    armado = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    for x, y in clics:
+        lineal(posiciones, x, y)
+    por_lineal = (time.perf_counter() - inicio) / CLICS
+
+    inicio = time.perf_counter()
+    for x, y in clics:
+        rejilla.mas_cercano(x, y, RADIO)
+    por_rejilla = (time.perf_counter() - inicio) / CLICS
+    return armado * 1000, por_lineal * 1e6, por_rejilla * 1e6
+
+
+def main():
+    print(f"{'nodos':>7} {'armado ms':>10} {'lineal µs/clic':>15} {'rejilla µs/clic':>16}")
+    for cantidad in TAMAÑOS:
+        armado, por_lineal, por_rejilla = medir(cantidad)
+        print(f"{cantidad:>7} {armado:>10.2f} {por_lineal:>15.1f} {por_rejilla:>16.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""Compara la detección de colisiones escalar contra el núcleo vectorizado.
+
+Para distintas cantidades de obstáculos visibles alrededor del carrito mide
+el costo por cuadro de: verificar_colision sobre todos los visibles, la
+rejilla de fase amplia y ColisionesVectorizadas. También comprueba que los
+tres métodos detecten exactamente los mismos obstáculos.
+
+Uso: python -m benchmarks.colisiones
+"""
+import contextlib
+import io
+import os
+import random
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from game.motor import Motor
+from game.obstaculo import Obstaculo
+from game.rejilla_colisiones import RejillaColisiones
+from game.colisiones_vectorizadas import ColisionesVectorizadas
+
+CUADROS = 200
+
+
+def preparar(cantidad):
+    with contextlib.redirect_stdout(io.StringIO()):
+        motor = Motor()
+        aleatorio = random.Random(cantidad)
+        obstaculos = []
+        for i in range(cantidad):
+            obstaculo = Obstaculo(aleatorio.randint(0, 760), aleatorio.randint(-600, 600))
+            obstaculo.x_original = i
+            obstaculo.y_original = 0
+            obstaculos.append(obstaculo)
+        motor.arbol_obstaculos.construir_desde(obstaculos)
+    return motor, obstaculos
+
+
+def medir(cantidad):
+    motor, obstaculos = preparar(cantidad)
+    carrito = motor.carrito
+    posiciones = [(random.randint(0, 750), random.randint(-600, 600)) for _ in range(CUADROS)]
+
+    rejilla = RejillaColisiones()
+    for obstaculo in obstaculos:
+        rejilla.agregar(obstaculo)
+    vectorizado = ColisionesVectorizadas()
+    vectorizado.sincronizar(motor.arbol_obstaculos)
+
+    tiempos = {'escalar': 0.0, 'rejilla': 0.0, 'numpy': 0.0}
+    for x, y in posiciones:
+        carrito.x, carrito.y = x, y
+
+        inicio = time.perf_counter()
+        escalar = [o for o in obstaculos if motor.verificar_colision(carrito, o)]
+        tiempos['escalar'] += time.perf_counter() - inicio
+
+        inicio = time.perf_counter()
+        candidatos = rejilla.consultar(carrito.obtener_rect_colision(), Obstaculo.ancho - 4, Obstaculo.alto - 4)
+        por_rejilla = [o for o in candidatos if motor.verificar_colision(carrito, o)]
+        tiempos['rejilla'] += time.perf_counter() - inicio
+
+        inicio = time.perf_counter()
+        por_numpy = vectorizado.detectar(motor.arbol_obstaculos, carrito.obtener_rect_colision())
+        tiempos['numpy'] += time.perf_counter() - inicio
+
+        # Se reactivan en el espejo para que los cuadros sean independientes
+        vectorizado.activos[:] = True
+        assert set(map(id, escalar)) == set(map(id, por_rejilla)) == set(map(id, por_numpy))
+
+    return {nombre: total / CUADROS * 1e6 for nombre, total in tiempos.items()}
+
+
+def main():
+    pygame.init()
+    print(f"{'visibles':>9} {'escalar µs':>11} {'rejilla µs':>11} {'numpy µs':>9}")
+    for cantidad in (10, 50, 100, 250, 500, 1000, 5000, 20000):
+        t = medir(cantidad)
+        print(f"{cantidad:>9} {t['escalar']:>11.1f} {t['rejilla']:>11.1f} {t['numpy']:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
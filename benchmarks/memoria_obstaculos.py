@@ -0,0 +1,77 @@
+"""Mide la memoria residente por obstáculo (Obstaculo + ObstaculoNode).
+
+Compara la representación actual con __slots__ contra una réplica de la
+representación anterior basada en __dict__.
+
+Uso: python -m benchmarks.memoria_obstaculos [cantidad]
+"""
+import sys
+import tracemalloc
+
+from game.obstaculo import Obstaculo
+from estructuras.arbol_avl_obstaculos import ObstaculoNode
+
+
+class _ObstaculoConDict:
+    """Réplica de Obstaculo antes de __slots__ y de la tabla de propiedades compartida"""
+    def __init__(self, x, y, tipo="roca"):
+        self.x = x
+        self.y = y
+        self.x_original = None
+        self.y_original = None
+        self.ancho = 40
+        self.alto = 40
+        self.tipo = tipo
+        self.activo = True
+        propiedades = {
+            "roca": {"color": (139, 69, 19), "danio_energia": 25, "descripcion": "Roca grande"},
+            "cono": {"color": (255, 165, 0), "danio_energia": 15, "descripcion": "Cono de tráfico"},
+            "hueco": {"color": (64, 64, 64), "danio_energia": 30, "descripcion": "Hueco en la carretera"},
+            "aceite": {"color": (75, 0, 130), "danio_energia": 10, "descripcion": "Mancha de aceite"}
+        }
+        self.color = propiedades[tipo]["color"]
+        self.danio_energia = propiedades[tipo]["danio_energia"]
+        self.descripcion = propiedades[tipo]["descripcion"]
+
+
+class _NodoConDict:
+    """Réplica de ObstaculoNode antes de __slots__"""
+    def __init__(self, obstaculo):
+        self.obstaculo = obstaculo
+        self.x = obstaculo.x_original
+        self.y = obstaculo.y_original
+        self.tipo = obstaculo.tipo
+        self.altura = 1
+        self.izquierdo = None
+        self.derecho = None
+
+
+def medir(clase_obstaculo, clase_nodo, cantidad):
+    """Retorna los bytes asignados por obstáculo, incluyendo su nodo del árbol"""
+    tipos = ("roca", "cono", "hueco", "aceite")
+    tracemalloc.start()
+    inicio = tracemalloc.get_traced_memory()[0]
+    nodos = []
+    for i in range(cantidad):
+        obstaculo = clase_obstaculo(i % 800, i, tipos[i % 4])
+        obstaculo.x_original = i
+        obstaculo.y_original = i % 3
+        nodos.append(clase_nodo(obstaculo))
+    usado = tracemalloc.get_traced_memory()[0] - inicio
+    tracemalloc.stop()
+    # La lista contenedora no forma parte del costo por obstáculo
+    return (usado - sys.getsizeof(nodos)) / cantidad
+
+
+def main():
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    antes = medir(_ObstaculoConDict, _NodoConDict, cantidad)
+    despues = medir(Obstaculo, ObstaculoNode, cantidad)
+    print(f"Obstáculos: {cantidad}")
+    print(f"Antes (__dict__):  {antes:8.1f} bytes/obstáculo")
+    print(f"Después (__slots__): {despues:8.1f} bytes/obstáculo")
+    print(f"Reducción: {100 * (1 - despues / antes):.1f}%")
+
+
+if __name__ == "__main__":
+    main()
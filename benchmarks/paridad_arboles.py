@@ -0,0 +1,116 @@
+"""Verifica que el árbol de punteros y el de arreglos se comporten igual.
+
+Aplica a ambos la misma secuencia aleatoria de inserciones, eliminaciones
+por clave y por rango, y después de cada operación compara lo que retornó,
+los cuatro recorridos, la altura, el tamaño, el factor de balance de cada
+nodo y las consultas de rango, rank y select. Las claves salen de un rango
+chico para que haya duplicados y eliminaciones de claves inexistentes.
+
+Uso: python -m benchmarks.paridad_arboles [operaciones] [semillas]
+"""
+import contextlib
+import io
+import random
+import sys
+
+from game.obstaculo import Obstaculo
+from estructuras.arbol_avl_obstaculos import ArbolAVLObstaculos
+from estructuras.arbol_avl_arreglos import ArbolAVLObstaculosArreglos
+
+TIPOS = ("roca", "cono", "hueco", "aceite")
+RECORRIDOS = ('inorden', 'preorden', 'postorden', 'anchura')
+X_MAXIMA = 300
+CARRILES = 3
+
+
+def crear_obstaculo(aleatorio):
+    obstaculo = Obstaculo(0, 0, aleatorio.choice(TIPOS))
+    obstaculo.x_original = aleatorio.randrange(X_MAXIMA)
+    obstaculo.y_original = aleatorio.randrange(CARRILES)
+    return obstaculo
+
+
+def estado(arbol, aleatorio):
+    """Todo lo observable del árbol; aleatorio elige las consultas y debe avanzar igual en ambos"""
+    recorridos = {tipo: [(str(nodo), nodo.altura, nodo.tamaño, nodo.obtener_factor_balance(), nodo.es_hoja())
+                         for nodo in arbol.obtener_recorrido(tipo)]
+                  for tipo in RECORRIDOS}
+    x_min = aleatorio.randrange(-10, X_MAXIMA)
+    x_max = x_min + aleatorio.randrange(60)
+    x, y = aleatorio.randrange(X_MAXIMA), aleatorio.randrange(CARRILES)
+    tamaño = arbol.obtener_tamaño()
+    return {
+        'recorridos': recorridos,
+        'altura': arbol.obtener_altura(),
+        'tamaño': tamaño,
+        'vacio': arbol.esta_vacio(),
+        'ordenados': [id(obstaculo) for obstaculo in arbol.obtener_obstaculos_ordenados()],
+        'rango': [str(nodo) for nodo in arbol.rango(x_min, x_max)],
+        'rango_count': arbol.rango_count(x_min, x_max),
+        'rank': arbol.rank(x, y),
+        'select': str(arbol.select(aleatorio.randrange(tamaño))) if tamaño else None
+    }
+
+
+def operar(arbol, operacion, argumentos):
+    if operacion == 'insertar':
+        return arbol.insertar_obstaculo(*argumentos)
+    if operacion == 'eliminar':
+        return arbol.eliminar_nodo(*argumentos)
+    if operacion == 'eliminar_rango':
+        return arbol.eliminar_rango(*argumentos)
+    return len(arbol.construir_desde(*argumentos))
+
+
+def comparar(operaciones, semilla):
+    """Retorna la primera operación en que los árboles difieren, o None"""
+    aleatorio = random.Random(semilla)
+    arboles = (ArbolAVLObstaculos(), ArbolAVLObstaculosArreglos())
+    for paso in range(operaciones):
+        eleccion = aleatorio.random()
+        if paso == 0 or eleccion < 0.01:
+            operacion = 'construir'
+            argumentos = ([crear_obstaculo(aleatorio) for _ in range(aleatorio.randrange(200))],)
+        elif eleccion < 0.55:
+            operacion, argumentos = 'insertar', (crear_obstaculo(aleatorio),)
+        elif eleccion < 0.95:
+            # La mitad de las veces, una clave que está en el árbol
+            nodos = arboles[0].obtener_recorrido('inorden')
+            if nodos and aleatorio.random() < 0.5:
+                nodo = aleatorio.choice(nodos)
+                argumentos = (nodo.x, nodo.y)
+            else:
+                argumentos = (aleatorio.randrange(X_MAXIMA), aleatorio.randrange(CARRILES))
+            operacion = 'eliminar'
+        else:
+            x_min = aleatorio.randrange(X_MAXIMA)
+            operacion, argumentos = 'eliminar_rango', (x_min, x_min + aleatorio.randrange(30))
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            retornos = [operar(arbol, operacion, argumentos) for arbol in arboles]
+        semilla_consultas = aleatorio.random()
+        estados = [estado(arbol, random.Random(semilla_consultas)) for arbol in arboles]
+        if retornos[0] != retornos[1] or estados[0] != estados[1]:
+            diferencias = [clave for clave in estados[0] if estados[0][clave] != estados[1][clave]]
+            if retornos[0] != retornos[1]:
+                diferencias.insert(0, 'retorno')
+            return paso, operacion, argumentos, diferencias
+    return None
+
+
+def main():
+    operaciones = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    semillas = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    fallas = 0
+    for semilla in range(semillas):
+        diferencia = comparar(operaciones, semilla)
+        if diferencia is not None:
+            fallas += 1
+            paso, operacion, argumentos, campos = diferencia
+            print(f"semilla {semilla}: difieren tras el paso {paso} ({operacion} {argumentos}) en {', '.join(campos)}")
+    print(f"{semillas - fallas} de {semillas} secuencias de {operaciones} operaciones iguales en ambos árboles")
+    return 1 if fallas else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
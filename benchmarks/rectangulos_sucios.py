@@ -0,0 +1,101 @@
+"""Compara GUI.renderizar con cuadro completo contra el modo de rects sucios.
+
+Para varios tamaños de ventana juega la misma partida con ambos modos y
+reporta el tiempo por cuadro y qué fracción de los pixeles de la ventana se
+envía en promedio (display.flip cuenta como la ventana entera). Después
+juega un nivel con obstáculos encimados en el mismo carril, cambiando de
+carril, y compara pixel a pixel cada cuadro de ambos modos.
+
+Uso: python -m benchmarks.rectangulos_sucios
+"""
+import contextlib
+import io
+import os
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from game.motor import Motor
+from game.gui import GUI
+
+CUADROS = 600
+TAMAÑOS = ((900, 600), (1920, 1080), (3840, 2160))
+# Obstáculos a pocas unidades uno del otro: sus sprites se superponen
+NIVEL_ENCIMADO = [{"x": 300 + 15 * i, "y": 1, "tipo": tipo}
+                  for i, tipo in enumerate(("cono", "roca", "cono", "hueco", "aceite", "roca"))]
+# Cuadro -> tecla, para que el carrito pase por encima y por debajo de los obstáculos
+CAMBIOS_CARRIL = {60: pygame.K_UP, 120: pygame.K_DOWN, 180: pygame.K_UP}
+
+
+class ContadorPixeles:
+    """Envuelve display.flip y display.update para sumar el área enviada"""
+    def __init__(self):
+        self.area = 0
+        self.flip = pygame.display.flip
+        self.update = pygame.display.update
+
+    def __enter__(self):
+        def flip():
+            self.area += pygame.display.get_surface().get_width() * pygame.display.get_surface().get_height()
+            self.flip()
+
+        def update(rects):
+            pantalla = pygame.display.get_surface().get_rect()
+            self.area += sum(pantalla.clip(rect).width * pantalla.clip(rect).height for rect in rects)
+            self.update(rects)
+
+        pygame.display.flip = flip
+        pygame.display.update = update
+        return self
+
+    def __exit__(self, *error):
+        pygame.display.flip = self.flip
+        pygame.display.update = self.update
+
+
+def medir(ancho, alto, sucios):
+    with contextlib.redirect_stdout(io.StringIO()):
+        motor = Motor()
+        gui = GUI(rectangulos_sucios=sucios)
+        gui.pantalla = pygame.display.set_mode((ancho, alto))
+        motor.manejar_eventos(pygame.event.Event(pygame.VIDEORESIZE, w=ancho, h=alto))
+        with ContadorPixeles() as contador:
+            inicio = time.perf_counter()
+            for _ in range(CUADROS):
+                motor.actualizar()
+                gui.renderizar(motor)
+            total = time.perf_counter() - inicio
+    return total / CUADROS * 1000, contador.area / (CUADROS * ancho * alto) * 100
+
+
+def cuadros(sucios):
+    """Pixeles de cada cuadro del nivel encimado"""
+    imagenes = []
+    with contextlib.redirect_stdout(io.StringIO()):
+        motor = Motor(nivel=NIVEL_ENCIMADO)
+        gui = GUI(rectangulos_sucios=sucios)
+        for cuadro in range(CUADROS):
+            if cuadro in CAMBIOS_CARRIL:
+                motor.manejar_eventos(pygame.event.Event(pygame.KEYDOWN, key=CAMBIOS_CARRIL[cuadro]))
+            motor.actualizar()
+            gui.renderizar(motor)
+            imagenes.append(pygame.image.tostring(gui.pantalla, "RGB"))
+    return imagenes
+
+
+def main():
+    pygame.init()
+    print(f"{'ventana':>10} {'completo ms':>12} {'sucios ms':>10} {'% enviado':>10}")
+    for ancho, alto in TAMAÑOS:
+        completo, _ = medir(ancho, alto, False)
+        sucios, enviado = medir(ancho, alto, True)
+        print(f"{ancho:>5}x{alto:<4} {completo:>12.3f} {sucios:>10.3f} {enviado:>9.1f}%")
+
+    distintos = sum(a != b for a, b in zip(cuadros(False), cuadros(True)))
+    print(f"obstáculos encimados: {distintos} de {CUADROS} cuadros distintos entre ambos modos")
+
+
+if __name__ == "__main__":
+    main()
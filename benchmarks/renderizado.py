@@ -0,0 +1,110 @@
+"""Mide el tiempo por cuadro del dibujo del juego.
+
+Compara tres caminos para varios tamaños de ventana:
+
+- girado: el de antes, que dibujaba el mundo en una superficie nueva, la
+  giraba -90° y la escalaba a la ventana;
+- sin caché: dibujo directo en orientación de pantalla, rasterizando cada
+  entidad en cada cuadro;
+- con caché: dibujo directo con CacheSprites, un blit por entidad.
+
+Solo se mide la parte del mundo (carretera, carrito y obstáculos); el HUD es
+igual en todos los casos. Además del nivel normal se prueba una pantalla
+cargada con OBSTACULOS_EXTRA obstáculos visibles.
+
+Uso: python -m benchmarks.renderizado
+"""
+import contextlib
+import io
+import os
+import random
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from game.motor import Motor
+from game.gui import GUI
+from game.obstaculo import Obstaculo
+from game.orientacion import rect_a_pantalla
+
+CUADROS = 300
+TAMAÑOS = ((900, 600), (1280, 720), (1920, 1080))
+OBSTACULOS_EXTRA = 150
+
+
+def dibujar_girado(gui, motor, ancho, alto):
+    superficie_juego = pygame.Surface((alto, ancho))
+    motor.carretera.dibujar_estatica(superficie_juego, alto, ancho)
+    motor.carrito.dibujar(superficie_juego, alto, ancho)
+    for obstaculo in motor.obstaculos:
+        obstaculo.dibujar(superficie_juego, alto, ancho)
+    superficie_rotada = pygame.transform.rotate(superficie_juego, -90)
+    superficie_escalada = pygame.transform.scale(superficie_rotada, (ancho, alto))
+    gui.pantalla.fill(gui.NEGRO)
+    gui.pantalla.blit(superficie_escalada, (0, 0))
+
+
+def dibujar_sin_cache(gui, motor, ancho, alto):
+    motor.carretera.dibujar_horizontal(gui.pantalla, ancho, alto)
+    margen = gui.cache_sprites.MARGEN
+    for entidad in [motor.carrito] + [o for o in motor.obstaculos if o.activo]:
+        rect = entidad.obtener_rect_dibujo(alto, ancho)
+        sprite = gui.cache_sprites.rasterizar(entidad, rect.width, rect.height)
+        x, y, _, _ = rect_a_pantalla(rect.x - margen, rect.y - margen,
+                                     rect.width + 2 * margen, rect.height + 2 * margen, ancho)
+        gui.pantalla.blit(sprite, (x, y))
+
+
+def dibujar_con_cache(gui, motor, ancho, alto):
+    gui.cache_sprites.ajustar_escala((ancho, alto))
+    motor.carretera.dibujar_horizontal(gui.pantalla, ancho, alto)
+    gui._dibujar_entidad(motor.carrito, ancho, alto)
+    for obstaculo in motor.obstaculos:
+        if obstaculo.activo:
+            gui._dibujar_entidad(obstaculo, ancho, alto)
+
+
+CAMINOS = (('girado', dibujar_girado), ('sin caché', dibujar_sin_cache), ('con caché', dibujar_con_cache))
+
+
+def medir(ancho, alto, extra):
+    with contextlib.redirect_stdout(io.StringIO()):
+        motor = Motor()
+        gui = GUI()
+        gui.pantalla = pygame.display.set_mode((ancho, alto))
+        motor.ancho_pantalla, motor.alto_pantalla = ancho, alto
+        motor.recalcular_posiciones_obstaculos()
+        motor.actualizar()
+    # Obstáculos sueltos alrededor del carrito para simular una pantalla cargada
+    aleatorio = random.Random(extra)
+    tipos = ("roca", "cono", "hueco", "aceite")
+    relleno = [Obstaculo(aleatorio.randint(0, 760), motor.carrito.y + aleatorio.randint(-800, 200),
+                         aleatorio.choice(tipos)) for _ in range(extra)]
+
+    tiempos = {nombre: 0.0 for nombre, _ in CAMINOS}
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(CUADROS):
+            motor.actualizar()
+            motor.obstaculos.extend(relleno)
+            for nombre, dibujar in CAMINOS:
+                inicio = time.perf_counter()
+                dibujar(gui, motor, ancho, alto)
+                tiempos[nombre] += time.perf_counter() - inicio
+            for _ in relleno:
+                motor.obstaculos.pop()
+    return {nombre: total / CUADROS * 1000 for nombre, total in tiempos.items()}
+
+
+def main():
+    pygame.init()
+    print(f"{'ventana':>10} {'extra':>6}" + "".join(f" {nombre + ' ms':>13}" for nombre, _ in CAMINOS))
+    for ancho, alto in TAMAÑOS:
+        for extra in (0, OBSTACULOS_EXTRA):
+            t = medir(ancho, alto, extra)
+            print(f"{ancho:>5}x{alto:<4} {extra:>6}" + "".join(f" {t[nombre]:>13.3f}" for nombre, _ in CAMINOS))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""Mide cuántos pasos de simulación por segundo corre el Motor sin ventana.
+
+Usa SimulacionSinVentana con un guion de entradas fijo (cambios de carril y
+saltos periódicos) para cada combinación de árbol, detección de colisiones y
+poda de obstáculos pasados.
+No abre ventana ni inicializa fuentes.
+
+Uso: python -m benchmarks.sin_ventana
+"""
+import contextlib
+import io
+import time
+
+import pygame
+
+from game.simulacion_sin_ventana import SimulacionSinVentana
+
+CUADROS = 20000
+
+
+def guion(motor, cuadro):
+    if cuadro % 90 == 0:
+        return (pygame.K_UP if (cuadro // 90) % 2 else pygame.K_DOWN,)
+    if cuadro % 150 == 0:
+        return (pygame.K_SPACE,)
+    return ()
+
+
+def medir(**opciones):
+    with contextlib.redirect_stdout(io.StringIO()):
+        simulacion = SimulacionSinVentana(guion, **opciones)
+        inicio = time.perf_counter()
+        pasos = simulacion.correr(CUADROS)
+        total = time.perf_counter() - inicio
+    return pasos, pasos / total
+
+
+def main():
+    print(f"{'árbol':>9} {'colisiones':>11} {'poda':>5} {'pasos':>7} {'pasos/s':>9}")
+    for tipo_arbol in ('punteros', 'arreglos'):
+        for vectorizadas in (False, True):
+            for podar in (False, True):
+                pasos, por_segundo = medir(tipo_arbol=tipo_arbol, colisiones_vectorizadas=vectorizadas,
+                                           podar_obstaculos=podar)
+                print(f"{tipo_arbol:>9} {'numpy' if vectorizadas else 'rejilla':>11} {'sí' if podar else 'no':>5} "
+                      f"{pasos:>7} {por_segundo:>9.0f}")
+    print(f"display iniciado: {pygame.display.get_init()}, fuentes iniciadas: {pygame.font.get_init()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""Mide el efecto de CacheTextos en GUI.renderizar.
+
+Juega la misma partida dos veces: con las cachés de texto del GUI y del
+visualizador del árbol, y con capacidad 0 (cada texto se vuelve a renderizar).
+La mitad de los cuadros se dibujan con el árbol AVL visible. Reporta el tiempo
+por cuadro y los aciertos y fallos de cada caché.
+
+Uso: python -m benchmarks.textos
+"""
+import contextlib
+import io
+import os
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from game.motor import Motor
+from game.gui import GUI
+from game.cache_textos import CacheTextos
+
+CUADROS = 600
+
+
+def medir(con_cache):
+    with contextlib.redirect_stdout(io.StringIO()):
+        motor = Motor()
+        gui = GUI()
+        if not con_cache:
+            gui.cache_textos = CacheTextos(0)
+            motor.visualizador_avl.cache_textos = CacheTextos(0)
+        tiempos = {False: 0.0, True: 0.0}
+        for cuadro in range(CUADROS):
+            motor.mostrar_arbol = cuadro >= CUADROS // 2
+            motor.actualizar()
+            inicio = time.perf_counter()
+            gui.renderizar(motor)
+            tiempos[motor.mostrar_arbol] += time.perf_counter() - inicio
+    por_cuadro = {arbol: total / (CUADROS // 2) * 1000 for arbol, total in tiempos.items()}
+    return por_cuadro, gui.cache_textos, motor.visualizador_avl.cache_textos
+
+
+def main():
+    pygame.init()
+    print(f"{'caché':>6} {'juego ms':>9} {'árbol ms':>9} {'GUI aciertos/fallos':>20} {'árbol aciertos/fallos':>22}")
+    for con_cache in (False, True):
+        t, cache_gui, cache_arbol = medir(con_cache)
+        print(f"{'sí' if con_cache else 'no':>6} {t[False]:>9.3f} {t[True]:>9.3f}"
+              f" {f'{cache_gui.aciertos}/{cache_gui.fallos}':>20}"
+              f" {f'{cache_arbol.aciertos}/{cache_arbol.fallos}':>22}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""Mide cuadros del visualizador del árbol mientras se mueve la cámara.
+
+Construye un árbol grande y arrastra la vista sobre sus niveles más bajos,
+donde hay más nodos juntos, con distintos zooms, hasta ver el árbol
+completo. Cada cuadro cambia la cámara, así que la capa del árbol se
+redibuja siempre.
+
+Uso: python -m benchmarks.vista_arbol [nodos]
+"""
+import contextlib
+import io
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from benchmarks.visualizador import construir
+from game.visualizador_avl import VisualizadorArbolAVL
+
+CUADROS = 60
+ZOOMS = (2.0, 1.0, 0.5, 0.2, 0.05, 0.01)
+
+
+def medir(visualizador, arbol, zoom, centro):
+    # La cámara arranca con centro en el medio de la superficie
+    visualizador.zoom = zoom
+    visualizador.vista_x = visualizador.ancho / 2 - centro[0] * zoom
+    visualizador.vista_y = visualizador.alto / 2 - centro[1] * zoom
+    inicio = time.perf_counter()
+    for _ in range(CUADROS):
+        visualizador.desplazar(7, 3)
+        visualizador.dibujar_arbol(arbol, mostrar_recorrido=True, tipo_recorrido='inorden')
+    return (time.perf_counter() - inicio) / CUADROS * 1000, len(visualizador.nodos_en_vista)
+
+
+def main():
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    pygame.init()
+    arbol = construir(cantidad)
+    visualizador = VisualizadorArbolAVL()
+    with contextlib.redirect_stdout(io.StringIO()):
+        inicio = time.perf_counter()
+        visualizador.dibujar_arbol(arbol, mostrar_recorrido=True, tipo_recorrido='inorden')
+        primero = (time.perf_counter() - inicio) * 1000
+        posiciones = visualizador._obtener_posiciones(arbol)
+        # Un nodo del último nivel, a un tercio del ancho
+        y_ultimo = max(y for _, y in posiciones.values())
+        ultimo_nivel = sorted(x for x, y in posiciones.values() if y == y_ultimo)
+        centro = (ultimo_nivel[len(ultimo_nivel) // 3], y_ultimo)
+        resultados = [(zoom, *medir(visualizador, arbol, zoom, centro)) for zoom in ZOOMS]
+        # Zoom con el que el árbol completo cabe a lo ancho, centrado en la raíz
+        x_min, x_max = visualizador.disposicion.acomodar(arbol.raiz)
+        completo = visualizador.ancho / ((x_max - x_min) * visualizador.unidad)
+        resultados.append((completo, *medir(visualizador, arbol, completo, posiciones[arbol.raiz])))
+
+    print(f"{cantidad} nodos, primer cuadro (disposición incluida): {primero:.1f} ms")
+    print(f"{'zoom':>8} {'cuadro ms':>10} {'fps':>8} {'nodos dibujados':>16}")
+    for zoom, cuadro, nodos in resultados:
+        print(f"{zoom:>8.4f} {cuadro:>10.2f} {1000 / cuadro:>8.0f} {nodos:>16}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""Mide el tiempo por cuadro de VisualizadorArbolAVL.dibujar_arbol.
+
+Construye árboles de distintos tamaños y dibuja varios cuadros seguidos con
+la numeración del recorrido activa, como hace el juego con el árbol visible.
+También mide cuánto tarda en rehacerse la disposición tras insertar un obstáculo.
+
+Uso: python -m benchmarks.visualizador
+"""
+import contextlib
+import io
+import os
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from estructuras.arbol_avl_obstaculos import ArbolAVLObstaculos
+from game.obstaculo import Obstaculo
+from game.visualizador_avl import VisualizadorArbolAVL
+
+CUADROS = 5
+TAMAÑOS = (100, 1000, 10000)
+TIPOS = ("roca", "cono", "hueco", "aceite")
+
+
+def construir(cantidad):
+    arbol = ArbolAVLObstaculos()
+    obstaculos = []
+    for i in range(cantidad):
+        obstaculo = Obstaculo(0, 0, TIPOS[i % len(TIPOS)])
+        obstaculo.x_original = i * 10
+        obstaculo.y_original = i % 3
+        obstaculos.append(obstaculo)
+    arbol.construir_desde(obstaculos)
+    return arbol
+
+
+def medir(cantidad, tipo_recorrido):
+    arbol = construir(cantidad)
+    visualizador = VisualizadorArbolAVL()
+    with contextlib.redirect_stdout(io.StringIO()):
+        inicio = time.perf_counter()
+        visualizador.dibujar_arbol(arbol, mostrar_recorrido=True, tipo_recorrido=tipo_recorrido)
+        primero = time.perf_counter() - inicio
+        inicio = time.perf_counter()
+        for _ in range(CUADROS):
+            visualizador.dibujar_arbol(arbol, mostrar_recorrido=True, tipo_recorrido=tipo_recorrido)
+        siguientes = (time.perf_counter() - inicio) / CUADROS
+        reubicar = 0
+        for i in range(CUADROS):
+            obstaculo = Obstaculo(0, 0, "roca")
+            obstaculo.x_original = cantidad * (i + 1) + 1
+            obstaculo.y_original = 1
+            arbol.insertar_obstaculo(obstaculo)
+            inicio = time.perf_counter()
+            visualizador._obtener_posiciones(arbol)
+            reubicar += (time.perf_counter() - inicio) / CUADROS
+    return primero * 1000, siguientes * 1000, reubicar * 1000
+
+
+def main():
+    pygame.init()
+    print(f"{'nodos':>6} {'recorrido':>10} {'primer cuadro ms':>17} {'cuadro ms':>10} {'reubicar ms':>12}")
+    for cantidad in TAMAÑOS:
+        for tipo_recorrido in ('inorden', 'anchura'):
+            primero, siguientes, reubicar = medir(cantidad, tipo_recorrido)
+            print(f"{cantidad:>6} {tipo_recorrido:>10} {primero:>17.2f} {siguientes:>10.2f} {reubicar:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
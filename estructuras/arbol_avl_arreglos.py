@@ -0,0 +1,567 @@
+from array import array
+from collections import deque
+
+NULO = -1
+
+def _clave_de(obstaculo):
+    """Clave (x, y) de un obstáculo, con la misma regla que ObstaculoNode"""
+    x = obstaculo.x_original if obstaculo.x_original is not None else obstaculo.x
+    y = obstaculo.y_original if obstaculo.y_original is not None else obstaculo.y
+    return x, y
+
+class NodoArreglo:
+    """Vista liviana de un nodo de ArbolAVLObstaculosArreglos.
+
+    Expone los mismos atributos que ObstaculoNode para que el motor y el
+    visualizador puedan recorrer ambos árboles sin distinguirlos.
+    """
+    __slots__ = ('arbol', 'indice')
+
+    def __init__(self, arbol, indice):
+        self.arbol = arbol
+        self.indice = indice
+
+    @property
+    def obstaculo(self):
+        return self.arbol.obstaculos[self.indice]
+
+    # Las columnas de claves son float; una clave entera se devuelve como int,
+    # igual que la guarda ObstaculoNode, para que se muestre igual en ambos árboles
+    @property
+    def x(self):
+        x = self.arbol.claves_x[self.indice]
+        return int(x) if x.is_integer() else x
+
+    @property
+    def y(self):
+        y = self.arbol.claves_y[self.indice]
+        return int(y) if y.is_integer() else y
+
+    @property
+    def tipo(self):
+        return self.arbol.nombres_tipos[self.arbol.tipos[self.indice]]
+
+    @property
+    def altura(self):
+        return self.arbol.alturas[self.indice]
+
+    @property
+    def tamaño(self):
+        return self.arbol.tamaños[self.indice]
+
+    @property
+    def izquierdo(self):
+        return self.arbol._vista(self.arbol.izquierdos[self.indice])
+
+    @property
+    def derecho(self):
+        return self.arbol._vista(self.arbol.derechos[self.indice])
+
+    def obtener_factor_balance(self):
+        return self.arbol._balance(self.indice)
+
+    def es_hoja(self):
+        return self.arbol.izquierdos[self.indice] == NULO and self.arbol.derechos[self.indice] == NULO
+
+    def __eq__(self, otro):
+        return isinstance(otro, NodoArreglo) and otro.arbol is self.arbol and otro.indice == self.indice
+
+    def __hash__(self):
+        return hash((id(self.arbol), self.indice))
+
+    def __str__(self):
+        return f"({self.x},{self.y})-{self.tipo}"
+
+class ArbolAVLObstaculosArreglos:
+    """Árbol AVL de obstáculos guardado en columnas paralelas.
+
+    Cada nodo es un índice entero sobre arreglos de clave x, clave y, id de
+    tipo, altura, hijo izquierdo e hijo derecho. Los nodos eliminados se
+    encadenan en una lista libre (a través de la columna izquierdos) y se
+    reutilizan en las siguientes inserciones.
+    """
+    def __init__(self):
+        self.nombres_tipos = []
+        self.ids_tipos = {}
+        self.recorrido_actual = []
+        self.recorridos_guardados = {'inorden': [], 'preorden': [], 'postorden': [], 'anchura': []}
+        self.version = 0
+        self.versiones_recorridos = {'inorden': 0, 'preorden': 0, 'postorden': 0, 'anchura': 0}
+        self._reiniciar_columnas()
+
+    def _reiniciar_columnas(self):
+        self.claves_x = array('d')
+        self.claves_y = array('d')
+        self.tipos = array('H')
+        self.alturas = array('b')
+        self.tamaños = array('i')
+        self.izquierdos = array('i')
+        self.derechos = array('i')
+        self.obstaculos = []
+        self.indice_raiz = NULO
+        self.libre = NULO
+        self.tamaño = 0
+
+    @property
+    def raiz(self):
+        return self._vista(self.indice_raiz)
+
+    def _vista(self, indice):
+        return NodoArreglo(self, indice) if indice != NULO else None
+
+    def _id_tipo(self, tipo):
+        id_tipo = self.ids_tipos.get(tipo)
+        if id_tipo is None:
+            id_tipo = len(self.nombres_tipos)
+            self.ids_tipos[tipo] = id_tipo
+            self.nombres_tipos.append(tipo)
+        return id_tipo
+
+    def _nuevo_nodo(self, obstaculo, x, y):
+        """Reserva un índice, reutilizando la lista libre si hay espacio"""
+        id_tipo = self._id_tipo(obstaculo.tipo)
+        if self.libre != NULO:
+            indice = self.libre
+            self.libre = self.izquierdos[indice]
+            self.claves_x[indice] = x
+            self.claves_y[indice] = y
+            self.tipos[indice] = id_tipo
+            self.alturas[indice] = 1
+            self.tamaños[indice] = 1
+            self.izquierdos[indice] = NULO
+            self.derechos[indice] = NULO
+            self.obstaculos[indice] = obstaculo
+            return indice
+        self.claves_x.append(x)
+        self.claves_y.append(y)
+        self.tipos.append(id_tipo)
+        self.alturas.append(1)
+        self.tamaños.append(1)
+        self.izquierdos.append(NULO)
+        self.derechos.append(NULO)
+        self.obstaculos.append(obstaculo)
+        return len(self.obstaculos) - 1
+
+    def _liberar(self, indice):
+        self.obstaculos[indice] = None
+        self.izquierdos[indice] = self.libre
+        self.derechos[indice] = NULO
+        self.libre = indice
+
+    def _altura(self, indice):
+        return self.alturas[indice] if indice != NULO else 0
+
+    def _balance(self, indice):
+        return self._altura(self.izquierdos[indice]) - self._altura(self.derechos[indice])
+
+    def _tamaño(self, indice):
+        return self.tamaños[indice] if indice != NULO else 0
+
+    def _actualizar_nodo(self, indice):
+        """Recalcula altura y tamaño del subárbol a partir de los hijos"""
+        izquierdo = self.izquierdos[indice]
+        derecho = self.derechos[indice]
+        self.alturas[indice] = 1 + max(self._altura(izquierdo), self._altura(derecho))
+        self.tamaños[indice] = 1 + self._tamaño(izquierdo) + self._tamaño(derecho)
+
+    def _rotar_derecha(self, y):
+        x = self.izquierdos[y]
+        self.izquierdos[y] = self.derechos[x]
+        self.derechos[x] = y
+        self._actualizar_nodo(y)
+        self._actualizar_nodo(x)
+        return x
+
+    def _rotar_izquierda(self, x):
+        y = self.derechos[x]
+        self.derechos[x] = self.izquierdos[y]
+        self.izquierdos[y] = x
+        self._actualizar_nodo(x)
+        self._actualizar_nodo(y)
+        return y
+
+    def _rebalancear(self, indice):
+        """Actualiza la altura del nodo y aplica la rotación AVL que corresponda"""
+        self._actualizar_nodo(indice)
+        balance = self._balance(indice)
+        if balance > 1:
+            if self._balance(self.izquierdos[indice]) < 0:
+                self.izquierdos[indice] = self._rotar_izquierda(self.izquierdos[indice])
+            return self._rotar_derecha(indice)
+        if balance < -1:
+            if self._balance(self.derechos[indice]) > 0:
+                self.derechos[indice] = self._rotar_derecha(self.derechos[indice])
+            return self._rotar_izquierda(indice)
+        return indice
+
+    def _rebalancear_camino(self, camino):
+        """Rebalancea de abajo hacia arriba los nodos del camino y reenlaza cada subárbol"""
+        hijo = NULO
+        for nivel in range(len(camino) - 1, -1, -1):
+            indice = camino[nivel]
+            if hijo != NULO:
+                # El hijo reemplazado cuelga del lado donde estaba el original
+                if self.izquierdos[indice] == camino[nivel + 1]:
+                    self.izquierdos[indice] = hijo
+                else:
+                    self.derechos[indice] = hijo
+            hijo = self._rebalancear(indice)
+        if camino:
+            self.indice_raiz = hijo
+
+    def _buscar_camino(self, x, y):
+        """Retorna (camino, encontrado) desde la raíz hasta la clave o su posición de inserción"""
+        camino = []
+        indice = self.indice_raiz
+        while indice != NULO:
+            camino.append(indice)
+            nx = self.claves_x[indice]
+            if x < nx or (x == nx and y < self.claves_y[indice]):
+                indice = self.izquierdos[indice]
+            elif x > nx or y > self.claves_y[indice]:
+                indice = self.derechos[indice]
+            else:
+                return camino, True
+        return camino, False
+
+    def insertar_obstaculo(self, obstaculo):
+        x, y = _clave_de(obstaculo)
+        camino, encontrado = self._buscar_camino(x, y)
+        if encontrado:
+            print(f"Advertencia: Coordenadas ({x}, {y}) ya existen. No se insertará.")
+            return False
+        nuevo = self._nuevo_nodo(obstaculo, x, y)
+        if camino:
+            padre = camino[-1]
+            if x < self.claves_x[padre] or (x == self.claves_x[padre] and y < self.claves_y[padre]):
+                self.izquierdos[padre] = nuevo
+            else:
+                self.derechos[padre] = nuevo
+            self._rebalancear_camino(camino)
+        else:
+            self.indice_raiz = nuevo
+        self.tamaño += 1
+        self._invalidar_recorridos()
+        return True
+
+    def construir_desde(self, obstaculos):
+        """Construye el árbol completo a partir de una colección de obstáculos.
+
+        Igual que en ArbolAVLObstaculos: ordena una vez, descarta duplicados y
+        enlaza un árbol perfectamente balanceado. Los nodos quedan contiguos en
+        las columnas, en orden inorden.
+        """
+        ordenados = sorted(((_clave_de(obstaculo), obstaculo) for obstaculo in obstaculos),
+                           key=lambda par: par[0])
+        self._reiniciar_columnas()
+        for clave, obstaculo in ordenados:
+            if self.obstaculos and clave == (self.claves_x[-1], self.claves_y[-1]):
+                print(f"Advertencia: Coordenadas ({clave[0]}, {clave[1]}) ya existen. No se insertará.")
+                continue
+            self._nuevo_nodo(obstaculo, clave[0], clave[1])
+
+        self.tamaño = len(self.obstaculos)
+        self.indice_raiz = self._construir_balanceado(0, self.tamaño)
+        self._invalidar_recorridos()
+        return list(self.obstaculos)
+
+    def _construir_balanceado(self, inicio, fin):
+        if inicio >= fin:
+            return NULO
+        medio = (inicio + fin) // 2
+        self.izquierdos[medio] = self._construir_balanceado(inicio, medio)
+        self.derechos[medio] = self._construir_balanceado(medio + 1, fin)
+        self._actualizar_nodo(medio)
+        return medio
+
+    def eliminar_nodo(self, x, y):
+        """Elimina un nodo por coordenadas; retorna si realmente existía"""
+        camino, encontrado = self._buscar_camino(x, y)
+        if not encontrado:
+            return False
+        objetivo = camino[-1]
+
+        if self.izquierdos[objetivo] != NULO and self.derechos[objetivo] != NULO:
+            # Copiar el sucesor inorden al nodo y eliminar el sucesor en su lugar
+            sucesor = self.derechos[objetivo]
+            camino.append(sucesor)
+            while self.izquierdos[sucesor] != NULO:
+                sucesor = self.izquierdos[sucesor]
+                camino.append(sucesor)
+            self.claves_x[objetivo] = self.claves_x[sucesor]
+            self.claves_y[objetivo] = self.claves_y[sucesor]
+            self.tipos[objetivo] = self.tipos[sucesor]
+            self.obstaculos[objetivo] = self.obstaculos[sucesor]
+            objetivo = sucesor
+
+        reemplazo = self.izquierdos[objetivo] if self.izquierdos[objetivo] != NULO else self.derechos[objetivo]
+        camino.pop()
+        if camino:
+            padre = camino[-1]
+            if self.izquierdos[padre] == objetivo:
+                self.izquierdos[padre] = reemplazo
+            else:
+                self.derechos[padre] = reemplazo
+            self._rebalancear_camino(camino)
+        else:
+            self.indice_raiz = reemplazo
+        self._liberar(objetivo)
+
+        self.tamaño -= 1
+        self._invalidar_recorridos()
+        return True
+
+    def eliminar_rango(self, x_min, x_max):
+        """Elimina todos los nodos con x_min <= x <= x_max; retorna cuántos eliminó.
+
+        Separa el rango con dos divisiones y una concatenación en O(log n);
+        los índices eliminados se devuelven a la lista libre en O(k).
+        """
+        if self.rango_count(x_min, x_max) == 0:
+            return 0
+        menores, resto = self._dividir(self.indice_raiz, x_min, False)
+        eliminados, mayores = self._dividir(resto, x_max, True)
+        self.indice_raiz = self._concatenar(menores, mayores)
+        cantidad = self.tamaños[eliminados]
+        pila = [eliminados]
+        while pila:
+            indice = pila.pop()
+            for hijo in (self.izquierdos[indice], self.derechos[indice]):
+                if hijo != NULO:
+                    pila.append(hijo)
+            self._liberar(indice)
+        self.tamaño -= cantidad
+        self._invalidar_recorridos()
+        return cantidad
+
+    def _dividir(self, indice, x, incluir_iguales):
+        """Divide un subárbol en (claves con x menor, resto); con incluir_iguales, x igual va a la izquierda"""
+        if indice == NULO:
+            return NULO, NULO
+        izquierdo, derecho = self.izquierdos[indice], self.derechos[indice]
+        nx = self.claves_x[indice]
+        if nx < x or (incluir_iguales and nx == x):
+            menores, mayores = self._dividir(derecho, x, incluir_iguales)
+            return self._unir(izquierdo, indice, menores), mayores
+        menores, mayores = self._dividir(izquierdo, x, incluir_iguales)
+        return menores, self._unir(mayores, indice, derecho)
+
+    def _unir(self, izquierdo, medio, derecho):
+        """Une dos subárboles AVL mediante un nodo medio (izquierdo < medio < derecho)"""
+        altura_izq = self._altura(izquierdo)
+        altura_der = self._altura(derecho)
+        if altura_izq > altura_der + 1:
+            self.derechos[izquierdo] = self._unir(self.derechos[izquierdo], medio, derecho)
+            return self._rebalancear(izquierdo)
+        if altura_der > altura_izq + 1:
+            self.izquierdos[derecho] = self._unir(izquierdo, medio, self.izquierdos[derecho])
+            return self._rebalancear(derecho)
+        self.izquierdos[medio] = izquierdo
+        self.derechos[medio] = derecho
+        self._actualizar_nodo(medio)
+        return medio
+
+    def _concatenar(self, izquierdo, derecho):
+        """Une dos subárboles sin nodo medio, usando el mínimo del derecho"""
+        if izquierdo == NULO:
+            return derecho
+        if derecho == NULO:
+            return izquierdo
+        minimo, resto = self._extraer_minimo(derecho)
+        return self._unir(izquierdo, minimo, resto)
+
+    def _extraer_minimo(self, indice):
+        """Separa el nodo mínimo de un subárbol; retorna (mínimo, subárbol restante)"""
+        if self.izquierdos[indice] == NULO:
+            return indice, self.derechos[indice]
+        minimo, self.izquierdos[indice] = self._extraer_minimo(self.izquierdos[indice])
+        return minimo, self._rebalancear(indice)
+
+    def _invalidar_recorridos(self):
+        """Marca los recorridos guardados como desactualizados"""
+        self.version += 1
+
+    def _indices_inorden(self):
+        pila = []
+        indice = self.indice_raiz
+        while pila or indice != NULO:
+            if indice != NULO:
+                pila.append(indice)
+                indice = self.izquierdos[indice]
+            else:
+                indice = pila.pop()
+                yield indice
+                indice = self.derechos[indice]
+
+    def _indices_preorden(self):
+        pila = [self.indice_raiz] if self.indice_raiz != NULO else []
+        while pila:
+            indice = pila.pop()
+            yield indice
+            if self.derechos[indice] != NULO:
+                pila.append(self.derechos[indice])
+            if self.izquierdos[indice] != NULO:
+                pila.append(self.izquierdos[indice])
+
+    def _indices_postorden(self):
+        pila = []
+        indice = self.indice_raiz
+        ultimo = NULO
+        while pila or indice != NULO:
+            if indice != NULO:
+                pila.append(indice)
+                indice = self.izquierdos[indice]
+            else:
+                tope = pila[-1]
+                derecho = self.derechos[tope]
+                if derecho != NULO and derecho != ultimo:
+                    indice = derecho
+                else:
+                    ultimo = pila.pop()
+                    yield ultimo
+
+    def _indices_anchura(self):
+        cola = deque([self.indice_raiz] if self.indice_raiz != NULO else [])
+        while cola:
+            indice = cola.popleft()
+            yield indice
+            if self.izquierdos[indice] != NULO:
+                cola.append(self.izquierdos[indice])
+            if self.derechos[indice] != NULO:
+                cola.append(self.derechos[indice])
+
+    def iter_inorden(self):
+        """Genera los nodos en inorden (Izquierdo-Raíz-Derecho) sin recursión"""
+        return (NodoArreglo(self, indice) for indice in self._indices_inorden())
+
+    def iter_preorden(self):
+        """Genera los nodos en preorden (Raíz-Izquierdo-Derecho) sin recursión"""
+        return (NodoArreglo(self, indice) for indice in self._indices_preorden())
+
+    def iter_postorden(self):
+        """Genera los nodos en postorden (Izquierdo-Derecho-Raíz) sin recursión"""
+        return (NodoArreglo(self, indice) for indice in self._indices_postorden())
+
+    def iter_anchura(self):
+        """Genera los nodos por niveles (BFS)"""
+        return (NodoArreglo(self, indice) for indice in self._indices_anchura())
+
+    def recorrido_inorden(self):
+        """Recorrido en profundidad: Inorden (Izquierdo-Raíz-Derecho)"""
+        return list(self.iter_inorden())
+
+    def recorrido_preorden(self):
+        """Recorrido en profundidad: Preorden (Raíz-Izquierdo-Derecho)"""
+        return list(self.iter_preorden())
+
+    def recorrido_postorden(self):
+        return list(self.iter_postorden())
+
+    def recorrido_anchura(self):
+        return list(self.iter_anchura())
+
+    def obtener_recorrido(self, tipo):
+        if tipo not in self.recorridos_guardados:
+            return []
+        if self.versiones_recorridos[tipo] != self.version:
+            self.recorridos_guardados[tipo] = getattr(self, f'recorrido_{tipo}')()
+            self.versiones_recorridos[tipo] = self.version
+        return self.recorridos_guardados[tipo]
+
+    def rango(self, x_min, x_max):
+        """Itera en orden los nodos con x_min <= x <= x_max, podando subárboles"""
+        pila = []
+        indice = self.indice_raiz
+        while pila or indice != NULO:
+            if indice != NULO:
+                if self.claves_x[indice] < x_min:
+                    indice = self.derechos[indice]
+                else:
+                    pila.append(indice)
+                    indice = self.izquierdos[indice]
+            else:
+                indice = pila.pop()
+                if self.claves_x[indice] > x_max:
+                    return
+                yield NodoArreglo(self, indice)
+                indice = self.derechos[indice]
+
+    def rank(self, x, y):
+        """Cantidad de nodos con clave menor que (x, y), en O(log n)"""
+        posicion = 0
+        indice = self.indice_raiz
+        while indice != NULO:
+            nx = self.claves_x[indice]
+            if x < nx or (x == nx and y <= self.claves_y[indice]):
+                indice = self.izquierdos[indice]
+            else:
+                posicion += 1 + self._tamaño(self.izquierdos[indice])
+                indice = self.derechos[indice]
+        return posicion
+
+    def select(self, k):
+        """Retorna el k-ésimo nodo en inorden (desde 0), en O(log n)"""
+        if not 0 <= k < self.tamaño:
+            raise IndexError(f"Posición {k} fuera del árbol de {self.tamaño} nodos")
+        indice = self.indice_raiz
+        while True:
+            tamaño_izq = self._tamaño(self.izquierdos[indice])
+            if k < tamaño_izq:
+                indice = self.izquierdos[indice]
+            elif k == tamaño_izq:
+                return NodoArreglo(self, indice)
+            else:
+                k -= tamaño_izq + 1
+                indice = self.derechos[indice]
+
+    def rango_count(self, x_min, x_max):
+        """Cantidad de nodos con x_min <= x <= x_max, en O(log n)"""
+        if x_max < x_min:
+            return 0
+        return self._contar_x_menores(x_max, True) - self._contar_x_menores(x_min, False)
+
+    def _contar_x_menores(self, x, incluir_iguales):
+        """Cantidad de nodos con clave x < x (o <= x si incluir_iguales)"""
+        cantidad = 0
+        indice = self.indice_raiz
+        while indice != NULO:
+            nx = self.claves_x[indice]
+            if nx < x or (incluir_iguales and nx == x):
+                cantidad += 1 + self._tamaño(self.izquierdos[indice])
+                indice = self.derechos[indice]
+            else:
+                indice = self.izquierdos[indice]
+        return cantidad
+
+    def obtener_obstaculos_ordenados(self):
+        return [self.obstaculos[indice] for indice in self._indices_inorden()]
+
+    def limpiar(self):
+        self._reiniciar_columnas()
+        self._invalidar_recorridos()
+
+    def obtener_altura(self):
+        return self._altura(self.indice_raiz)
+
+    def esta_vacio(self):
+        return self.indice_raiz == NULO
+
+    def obtener_tamaño(self):
+        return self.tamaño
+
+    def imprimir_estructura(self):
+        """Imprime la estructura del árbol para debugging"""
+        print("Estructura del Árbol AVL (arreglos):")
+        pila = [(self.indice_raiz, "", True)] if self.indice_raiz != NULO else []
+        while pila:
+            indice, prefijo, es_ultimo = pila.pop()
+            nodo = NodoArreglo(self, indice)
+            print(f"{prefijo}{'└── ' if es_ultimo else '├── '}{nodo} (h:{nodo.altura}, b:{nodo.obtener_factor_balance()})")
+            hijo_prefijo = prefijo + ("    " if es_ultimo else "│   ")
+            izquierdo = self.izquierdos[indice]
+            derecho = self.derechos[indice]
+            # Se apila al revés para imprimir primero el derecho, como ArbolAVLObstaculos
+            if izquierdo != NULO:
+                pila.append((izquierdo, hijo_prefijo, True))
+            if derecho != NULO:
+                pila.append((derecho, hijo_prefijo, izquierdo == NULO))
@@ -2,14 +2,22 @@ from collections import deque
 import pygame
 
 class ObstaculoNode:
+    # x, y son la clave de búsqueda; se guardan en el nodo porque se leen en cada comparación
+    __slots__ = ('obstaculo', 'x', 'y', 'altura', 'tamaño', 'izquierdo', 'derecho')
+
     def __init__(self, obstaculo):
         self.obstaculo = obstaculo
         self.x = obstaculo.x_original if hasattr(obstaculo, 'x_original') and obstaculo.x_original is not None else obstaculo.x
         self.y = obstaculo.y_original if hasattr(obstaculo, 'y_original') and obstaculo.y_original is not None else obstaculo.y
-        self.tipo = obstaculo.tipo
         self.altura = 1
+        # Cantidad de nodos del subárbol, para consultas de rango y posición en O(log n)
+        self.tamaño = 1
         self.izquierdo = None
         self.derecho = None
+
+    @property
+    def tipo(self):
+        return self.obstaculo.tipo
         
     def comparar_con(self, otro):
         if self.x < otro.x:
@@ -33,6 +41,11 @@ class ObstaculoNode:
         altura_der = self.derecho.altura if self.derecho else 0
         self.altura = 1 + max(altura_izq, altura_der)
     
+    def actualizar_tamaño(self):
+        tamaño_izq = self.izquierdo.tamaño if self.izquierdo else 0
+        tamaño_der = self.derecho.tamaño if self.derecho else 0
+        self.tamaño = 1 + tamaño_izq + tamaño_der
+    
     def es_hoja(self):
         return self.izquierdo is None and self.derecho is None
     
@@ -51,49 +64,82 @@ class ArbolAVLObstaculos:
         self.tamaño = 0
         self.recorrido_actual = []
         self.recorridos_guardados = {'inorden': [], 'preorden': [], 'postorden': [], 'anchura': []}
+        # Contador de mutaciones; cada recorrido guarda la versión con la que se calculó
+        self.version = 0
+        self.versiones_recorridos = {'inorden': 0, 'preorden': 0, 'postorden': 0, 'anchura': 0}
     
     def insertar_obstaculo(self, obstaculo):
         nuevo_nodo = ObstaculoNode(obstaculo)
-        if self._coordenadas_existen(nuevo_nodo.x, nuevo_nodo.y):
+        if not self._insertar_iterativo(nuevo_nodo):
             print(f"Advertencia: Coordenadas ({nuevo_nodo.x}, {nuevo_nodo.y}) ya existen. No se insertará.")
             return False
-        self.raiz = self._insertar_recursivo(self.raiz, nuevo_nodo)
         self.tamaño += 1
-        self._actualizar_recorridos()
+        self._invalidar_recorridos()
         return True
     
-    def _coordenadas_existen(self, x, y):
-        return self._buscar_coordenadas(self.raiz, x, y) is not None
-    
-    def _buscar_coordenadas(self, nodo, x, y):
-        if nodo is None:
+    def construir_desde(self, obstaculos):
+        """Construye el árbol completo a partir de una colección de obstáculos.
+
+        Ordena una sola vez por (x, y), descarta duplicados en la misma pasada
+        (se conserva el primero) y arma un árbol perfectamente balanceado de
+        abajo hacia arriba. Retorna la lista de obstáculos insertados en orden.
+        """
+        nodos = sorted((ObstaculoNode(obstaculo) for obstaculo in obstaculos),
+                       key=lambda nodo: (nodo.x, nodo.y))
+        unicos = []
+        for nodo in nodos:
+            if unicos and unicos[-1].x == nodo.x and unicos[-1].y == nodo.y:
+                print(f"Advertencia: Coordenadas ({nodo.x}, {nodo.y}) ya existen. No se insertará.")
+                continue
+            unicos.append(nodo)
+        
+        self.raiz = self._construir_balanceado(unicos, 0, len(unicos))
+        self.tamaño = len(unicos)
+        self._invalidar_recorridos()
+        return [nodo.obstaculo for nodo in unicos]
+    
+    def _construir_balanceado(self, nodos, inicio, fin):
+        """Enlaza nodos[inicio:fin] (ya ordenados) tomando el medio como raíz"""
+        if inicio >= fin:
             return None
-        if x < nodo.x or (x == nodo.x and y < nodo.y):
-            return self._buscar_coordenadas(nodo.izquierdo, x, y)
-        elif x > nodo.x or (x == nodo.x and y > nodo.y):
-            return self._buscar_coordenadas(nodo.derecho, x, y)
-        else:
-            return nodo
+        medio = (inicio + fin) // 2
+        nodo = nodos[medio]
+        nodo.izquierdo = self._construir_balanceado(nodos, inicio, medio)
+        nodo.derecho = self._construir_balanceado(nodos, medio + 1, fin)
+        nodo.actualizar_altura()
+        nodo.actualizar_tamaño()
+        return nodo
     
-    def _insertar_recursivo(self, nodo, nuevo_nodo):
-        """Inserción recursiva con balanceo AVL"""
-        # Caso base
-        if nodo is None:
-            return nuevo_nodo
-        
-        # Comparación según las reglas especificadas
-        comparacion = nuevo_nodo.comparar_con(nodo)
-        
-        if comparacion < 0:
-            nodo.izquierdo = self._insertar_recursivo(nodo.izquierdo, nuevo_nodo)
-        elif comparacion > 0:
-            nodo.derecho = self._insertar_recursivo(nodo.derecho, nuevo_nodo)
+    def _insertar_iterativo(self, nuevo_nodo):
+        """Inserción iterativa con balanceo AVL; retorna False si la clave ya existe"""
+        # Descender guardando el camino desde la raíz
+        camino = []
+        nodo = self.raiz
+        while nodo is not None:
+            comparacion = nuevo_nodo.comparar_con(nodo)
+            if comparacion == 0:
+                return False
+            camino.append(nodo)
+            nodo = nodo.izquierdo if comparacion < 0 else nodo.derecho
+        
+        if not camino:
+            self.raiz = nuevo_nodo
+            return True
+        
+        padre = camino[-1]
+        if nuevo_nodo.comparar_con(padre) < 0:
+            padre.izquierdo = nuevo_nodo
         else:
-            # Coordenadas idénticas - no debería pasar si verificamos antes
-            return nodo
+            padre.derecho = nuevo_nodo
         
-        # Actualizar altura
+        self.raiz = self._rebalancear_camino(camino, lambda nodo: self._balancear_insercion(nodo, nuevo_nodo))
+        return True
+    
+    def _balancear_insercion(self, nodo, nuevo_nodo):
+        """Actualiza un nodo del camino de inserción y lo rota si quedó desbalanceado"""
+        # Actualizar altura y tamaño
         nodo.actualizar_altura()
+        nodo.actualizar_tamaño()
         
         # Obtener factor de balance
         balance = nodo.obtener_factor_balance()
@@ -119,6 +165,23 @@ class ArbolAVLObstaculos:
         
         return nodo
     
+    def _rebalancear_camino(self, camino, balancear):
+        """Aplica balancear a los nodos del camino, de la hoja a la raíz.
+
+        Cada subárbol resultante se vuelve a enlazar en su padre, en el lado
+        donde estaba el nodo original. Retorna la nueva raíz.
+        """
+        subarbol = None
+        for i in range(len(camino) - 1, -1, -1):
+            nodo = camino[i]
+            if subarbol is not None:
+                if nodo.izquierdo is camino[i + 1]:
+                    nodo.izquierdo = subarbol
+                else:
+                    nodo.derecho = subarbol
+            subarbol = balancear(nodo)
+        return subarbol
+    
     def _rotacion_izquierda(self, z):
         """Rotación simple a la izquierda"""
         y = z.derecho
@@ -129,6 +192,8 @@ class ArbolAVLObstaculos:
         
         z.actualizar_altura()
         y.actualizar_altura()
+        z.actualizar_tamaño()
+        y.actualizar_tamaño()
         
         return y
     
@@ -142,75 +207,168 @@ class ArbolAVLObstaculos:
         
         z.actualizar_altura()
         y.actualizar_altura()
+        z.actualizar_tamaño()
+        y.actualizar_tamaño()
         
         return y
     
-    def _actualizar_recorridos(self):
-        """Actualiza todos los recorridos del árbol"""
-        self.recorridos_guardados['inorden'] = self.recorrido_inorden()
-        self.recorridos_guardados['preorden'] = self.recorrido_preorden()
-        self.recorridos_guardados['postorden'] = self.recorrido_postorden()
-        self.recorridos_guardados['anchura'] = self.recorrido_anchura()
+    def _invalidar_recorridos(self):
+        """Marca los recorridos guardados como desactualizados.
+
+        Los recorridos se recalculan de forma perezosa en obtener_recorrido,
+        solo cuando se piden después de una modificación.
+        """
+        self.version += 1
+    
+    def iter_inorden(self):
+        """Genera los nodos en inorden (Izquierdo-Raíz-Derecho) sin recursión"""
+        pila = []
+        nodo = self.raiz
+        while pila or nodo is not None:
+            if nodo is not None:
+                pila.append(nodo)
+                nodo = nodo.izquierdo
+            else:
+                nodo = pila.pop()
+                yield nodo
+                nodo = nodo.derecho
+    
+    def iter_preorden(self):
+        """Genera los nodos en preorden (Raíz-Izquierdo-Derecho) sin recursión"""
+        pila = [self.raiz] if self.raiz is not None else []
+        while pila:
+            nodo = pila.pop()
+            yield nodo
+            if nodo.derecho:
+                pila.append(nodo.derecho)
+            if nodo.izquierdo:
+                pila.append(nodo.izquierdo)
+    
+    def iter_postorden(self):
+        """Genera los nodos en postorden (Izquierdo-Derecho-Raíz) sin recursión"""
+        pila = []
+        nodo = self.raiz
+        ultimo = None
+        while pila or nodo is not None:
+            if nodo is not None:
+                pila.append(nodo)
+                nodo = nodo.izquierdo
+            else:
+                tope = pila[-1]
+                if tope.derecho is not None and tope.derecho is not ultimo:
+                    nodo = tope.derecho
+                else:
+                    ultimo = pila.pop()
+                    yield ultimo
+    
+    def iter_anchura(self):
+        """Genera los nodos por niveles (BFS)"""
+        cola = deque([self.raiz] if self.raiz is not None else [])
+        while cola:
+            nodo = cola.popleft()
+            yield nodo
+            if nodo.izquierdo:
+                cola.append(nodo.izquierdo)
+            if nodo.derecho:
+                cola.append(nodo.derecho)
     
     def recorrido_inorden(self):
         """Recorrido en profundidad: Inorden (Izquierdo-Raíz-Derecho)"""
-        resultado = []
-        self._inorden_recursivo(self.raiz, resultado)
-        return resultado
-    
-    def _inorden_recursivo(self, nodo, resultado):
-        if nodo is not None:
-            self._inorden_recursivo(nodo.izquierdo, resultado)
-            resultado.append(nodo)
-            self._inorden_recursivo(nodo.derecho, resultado)
+        return list(self.iter_inorden())
     
     def recorrido_preorden(self):
         """Recorrido en profundidad: Preorden (Raíz-Izquierdo-Derecho)"""
-        resultado = []
-        self._preorden_recursivo(self.raiz, resultado)
-        return resultado
-    
-    def _preorden_recursivo(self, nodo, resultado):
-        if nodo is not None:
-            resultado.append(nodo)
-            self._preorden_recursivo(nodo.izquierdo, resultado)
-            self._preorden_recursivo(nodo.derecho, resultado)
+        return list(self.iter_preorden())
     
     def recorrido_postorden(self):
-        resultado = []
-        self._postorden_recursivo(self.raiz, resultado)
-        return resultado
-    
-    def _postorden_recursivo(self, nodo, resultado):
-        if nodo is not None:
-            self._postorden_recursivo(nodo.izquierdo, resultado)
-            self._postorden_recursivo(nodo.derecho, resultado)
-            resultado.append(nodo)
+        return list(self.iter_postorden())
     
     def recorrido_anchura(self):
-        if self.raiz is None:
-            return []
-        resultado = []
-        cola = deque([self.raiz])
-        while cola:
-            nodo = cola.popleft()
-            resultado.append(nodo)
-            if nodo.izquierdo:
-                cola.append(nodo.izquierdo)
-            if nodo.derecho:
-                cola.append(nodo.derecho)
-        return resultado
+        return list(self.iter_anchura())
     
     def obtener_recorrido(self, tipo):
-        return self.recorridos_guardados.get(tipo, [])
+        if tipo not in self.recorridos_guardados:
+            return []
+        if self.versiones_recorridos[tipo] != self.version:
+            self.recorridos_guardados[tipo] = getattr(self, f'recorrido_{tipo}')()
+            self.versiones_recorridos[tipo] = self.version
+        return self.recorridos_guardados[tipo]
+    
+    def rango(self, x_min, x_max):
+        """Itera en orden los nodos con x_min <= x <= x_max.
+
+        Poda los subárboles que quedan fuera de la ventana, por lo que el costo
+        es O(log n + k) para k nodos dentro del rango.
+        """
+        pila = []
+        nodo = self.raiz
+        while pila or nodo is not None:
+            if nodo is not None:
+                if nodo.x < x_min:
+                    # Todo el subárbol izquierdo queda antes de la ventana
+                    nodo = nodo.derecho
+                else:
+                    pila.append(nodo)
+                    nodo = nodo.izquierdo
+            else:
+                nodo = pila.pop()
+                if nodo.x > x_max:
+                    return
+                yield nodo
+                nodo = nodo.derecho
+    
+    def rank(self, x, y):
+        """Cantidad de nodos con clave menor que (x, y), en O(log n)"""
+        posicion = 0
+        nodo = self.raiz
+        while nodo is not None:
+            if x < nodo.x or (x == nodo.x and y <= nodo.y):
+                nodo = nodo.izquierdo
+            else:
+                posicion += 1 + (nodo.izquierdo.tamaño if nodo.izquierdo else 0)
+                nodo = nodo.derecho
+        return posicion
+    
+    def select(self, k):
+        """Retorna el k-ésimo nodo en inorden (desde 0), en O(log n)"""
+        if not 0 <= k < self.tamaño:
+            raise IndexError(f"Posición {k} fuera del árbol de {self.tamaño} nodos")
+        nodo = self.raiz
+        while True:
+            tamaño_izq = nodo.izquierdo.tamaño if nodo.izquierdo else 0
+            if k < tamaño_izq:
+                nodo = nodo.izquierdo
+            elif k == tamaño_izq:
+                return nodo
+            else:
+                k -= tamaño_izq + 1
+                nodo = nodo.derecho
+    
+    def rango_count(self, x_min, x_max):
+        """Cantidad de nodos con x_min <= x <= x_max, en O(log n)"""
+        if x_max < x_min:
+            return 0
+        return self._contar_x_menores(x_max, True) - self._contar_x_menores(x_min, False)
+    
+    def _contar_x_menores(self, x, incluir_iguales):
+        """Cantidad de nodos con nodo.x < x (o <= x si incluir_iguales)"""
+        cantidad = 0
+        nodo = self.raiz
+        while nodo is not None:
+            if nodo.x < x or (incluir_iguales and nodo.x == x):
+                cantidad += 1 + (nodo.izquierdo.tamaño if nodo.izquierdo else 0)
+                nodo = nodo.derecho
+            else:
+                nodo = nodo.izquierdo
+        return cantidad
     
     def obtener_obstaculos_ordenados(self):
-        return [nodo.obstaculo for nodo in self.recorrido_inorden()]
+        return [nodo.obstaculo for nodo in self.iter_inorden()]
     
     def limpiar(self):
         self.raiz = None
         self.tamaño = 0
-        self.recorridos_guardados = {'inorden': [], 'preorden': [], 'postorden': [], 'anchura': []}
+        self._invalidar_recorridos()
     
     def obtener_altura(self):
         return self.raiz.altura if self.raiz else 0
@@ -237,66 +395,68 @@ class ArbolAVLObstaculos:
                     self._imprimir_nodo(nodo.izquierdo, prefijo + ("    " if es_ultimo else "│   "), True)
     
     def eliminar_nodo(self, x, y):
-        """Elimina un nodo del árbol AVL por coordenadas"""
-        if self.raiz is None:
+        """Elimina un nodo del árbol AVL por coordenadas; retorna si realmente existía"""
+        if not self._eliminar_iterativo(x, y):
             return False
-        
-        # Crear nodo temporal para búsqueda
-        from game.obstaculo import Obstaculo
-        obstaculo_temp = Obstaculo(0, 0, "temp")
-        obstaculo_temp.x_original = x
-        obstaculo_temp.y_original = y
-        nodo_temp = ObstaculoNode(obstaculo_temp)
-        
-        self.raiz = self._eliminar_recursivo(self.raiz, nodo_temp)
-        
-        if self.raiz:
-            self._actualizar_recorridos()
-        
+        self._invalidar_recorridos()
         return True
     
-    def _eliminar_recursivo(self, nodo, nodo_a_eliminar):
-        """Elimina un nodo recursivamente manteniendo el balance AVL"""
-        # Paso 1: Eliminación estándar de BST
-        if nodo is None:
-            return nodo
+    def _eliminar_iterativo(self, x, y):
+        """Elimina la clave (x, y) manteniendo el balance AVL; retorna si existía"""
+        # Paso 1: Búsqueda estándar de BST por clave, guardando el camino
+        camino = []
+        nodo = self.raiz
+        while nodo is not None:
+            if x < nodo.x or (x == nodo.x and y < nodo.y):
+                camino.append(nodo)
+                nodo = nodo.izquierdo
+            elif x > nodo.x or (x == nodo.x and y > nodo.y):
+                camino.append(nodo)
+                nodo = nodo.derecho
+            else:
+                break
         
-        comparacion = nodo_a_eliminar.comparar_con(nodo)
+        if nodo is None:
+            return False
         
-        if comparacion < 0:
-            nodo.izquierdo = self._eliminar_recursivo(nodo.izquierdo, nodo_a_eliminar)
-        elif comparacion > 0:
-            nodo.derecho = self._eliminar_recursivo(nodo.derecho, nodo_a_eliminar)
-        else:
-            # Nodo encontrado, eliminarlo
-            self.tamaño -= 1
-            
-            # Caso 1: Nodo con 0 o 1 hijo
-            if nodo.izquierdo is None:
-                return nodo.derecho
-            elif nodo.derecho is None:
-                return nodo.izquierdo
-            
-            # Caso 2: Nodo con 2 hijos
+        # Caso 2: Nodo con 2 hijos
+        if nodo.izquierdo is not None and nodo.derecho is not None:
             # Encontrar el sucesor inorden (nodo más pequeño en subárbol derecho)
-            sucesor = self._encontrar_minimo(nodo.derecho)
+            camino.append(nodo)
+            sucesor = nodo.derecho
+            while sucesor.izquierdo is not None:
+                camino.append(sucesor)
+                sucesor = sucesor.izquierdo
             
-            # Copiar datos del sucesor al nodo actual
+            # Copiar datos del sucesor al nodo actual y eliminar el sucesor en su lugar
             nodo.obstaculo = sucesor.obstaculo
             nodo.x = sucesor.x
             nodo.y = sucesor.y
-            nodo.tipo = sucesor.tipo
-            
-            # Eliminar el sucesor
-            nodo.derecho = self._eliminar_recursivo(nodo.derecho, sucesor)
+            nodo = sucesor
+        
+        # Caso 1: Nodo con 0 o 1 hijo, se reemplaza por su hijo
+        reemplazo = nodo.izquierdo if nodo.izquierdo is not None else nodo.derecho
+        self.tamaño -= 1
+        if not camino:
+            self.raiz = reemplazo
+            return True
+        
+        padre = camino[-1]
+        if padre.izquierdo is nodo:
+            padre.izquierdo = reemplazo
+        else:
+            padre.derecho = reemplazo
         
-        # Paso 2: Actualizar altura
+        # Paso 2: Actualizar alturas y rebalancear hasta la raíz
+        self.raiz = self._rebalancear_camino(camino, self._rebalancear)
+        return True
+    
+    def _rebalancear(self, nodo):
+        """Actualiza un nodo y lo rota si quedó desbalanceado (al eliminar, dividir o unir)"""
         nodo.actualizar_altura()
-        
-        # Paso 3: Obtener factor de balance
+        nodo.actualizar_tamaño()
         balance = nodo.obtener_factor_balance()
         
-        # Paso 4: Rebalancear si es necesario
         # Rotación derecha (caso Left-Left)
         if balance > 1 and nodo.izquierdo.obtener_factor_balance() >= 0:
             return self._rotar_derecha(nodo)
@@ -317,11 +477,97 @@ class ArbolAVLObstaculos:
         
         return nodo
     
-    def _encontrar_minimo(self, nodo):
-        """Encuentra el nodo con valor mínimo en un subárbol"""
-        while nodo.izquierdo is not None:
-            nodo = nodo.izquierdo
-        return nodo
+    def split(self, x):
+        """Divide el árbol en dos árboles: claves con x menor y claves con x mayor o igual.
+
+        Cuesta O(log n). Los nodos pasan a los árboles resultantes y este
+        árbol queda vacío.
+        """
+        menores, mayores = self._dividir(self.raiz, x, False)
+        self.limpiar()
+        return self._desde_raiz(menores), self._desde_raiz(mayores)
+    
+    def join(self, otro):
+        """Agrega al final los nodos de otro árbol cuyas claves son todas mayores.
+
+        Cuesta O(log n). El otro árbol queda vacío.
+        """
+        if self.raiz is not None and otro.raiz is not None:
+            maximo = self.select(self.tamaño - 1)
+            minimo = otro.select(0)
+            if maximo.comparar_con(minimo) >= 0:
+                raise ValueError("join requiere que todas las claves del otro árbol sean mayores")
+        self.raiz = self._concatenar(self.raiz, otro.raiz)
+        self.tamaño += otro.tamaño
+        self._invalidar_recorridos()
+        otro.limpiar()
+    
+    def eliminar_rango(self, x_min, x_max):
+        """Elimina todos los nodos con x_min <= x <= x_max; retorna cuántos eliminó.
+
+        Usa dos divisiones y una concatenación, O(log n) sin importar cuántos
+        nodos se eliminen.
+        """
+        if self.rango_count(x_min, x_max) == 0:
+            return 0
+        menores, resto = self._dividir(self.raiz, x_min, False)
+        eliminados, mayores = self._dividir(resto, x_max, True)
+        self.raiz = self._concatenar(menores, mayores)
+        cantidad = eliminados.tamaño
+        self.tamaño -= cantidad
+        self._invalidar_recorridos()
+        return cantidad
+    
+    def _desde_raiz(self, raiz):
+        arbol = ArbolAVLObstaculos()
+        arbol.raiz = raiz
+        arbol.tamaño = raiz.tamaño if raiz else 0
+        arbol._invalidar_recorridos()
+        return arbol
+    
+    def _dividir(self, nodo, x, incluir_iguales):
+        """Divide un subárbol en (claves con x menor, resto); con incluir_iguales, x igual va a la izquierda"""
+        if nodo is None:
+            return None, None
+        izquierdo, derecho = nodo.izquierdo, nodo.derecho
+        if nodo.x < x or (incluir_iguales and nodo.x == x):
+            menores, mayores = self._dividir(derecho, x, incluir_iguales)
+            return self._unir(izquierdo, nodo, menores), mayores
+        menores, mayores = self._dividir(izquierdo, x, incluir_iguales)
+        return menores, self._unir(mayores, nodo, derecho)
+    
+    def _unir(self, izquierdo, medio, derecho):
+        """Une dos subárboles AVL mediante un nodo medio (izquierdo < medio < derecho)"""
+        altura_izq = izquierdo.altura if izquierdo else 0
+        altura_der = derecho.altura if derecho else 0
+        if altura_izq > altura_der + 1:
+            # Bajar por el borde derecho del subárbol más alto
+            izquierdo.derecho = self._unir(izquierdo.derecho, medio, derecho)
+            return self._rebalancear(izquierdo)
+        if altura_der > altura_izq + 1:
+            derecho.izquierdo = self._unir(izquierdo, medio, derecho.izquierdo)
+            return self._rebalancear(derecho)
+        medio.izquierdo = izquierdo
+        medio.derecho = derecho
+        medio.actualizar_altura()
+        medio.actualizar_tamaño()
+        return medio
+    
+    def _concatenar(self, izquierdo, derecho):
+        """Une dos subárboles sin nodo medio, usando el mínimo del derecho"""
+        if izquierdo is None:
+            return derecho
+        if derecho is None:
+            return izquierdo
+        minimo, resto = self._extraer_minimo(derecho)
+        return self._unir(izquierdo, minimo, resto)
+    
+    def _extraer_minimo(self, nodo):
+        """Separa el nodo mínimo de un subárbol; retorna (mínimo, subárbol restante)"""
+        if nodo.izquierdo is None:
+            return nodo, nodo.derecho
+        minimo, nodo.izquierdo = self._extraer_minimo(nodo.izquierdo)
+        return minimo, self._rebalancear(nodo)
     
     def _rotar_derecha(self, y):
         """Realiza una rotación derecha (Right Rotation)"""
@@ -341,6 +587,10 @@ class ArbolAVLObstaculos:
         altura_der_x = x.derecho.altura if x.derecho else 0
         x.altura = 1 + max(altura_izq_x, altura_der_x)
         
+        # Actualizar tamaños (primero el nodo que quedó abajo)
+        y.actualizar_tamaño()
+        x.actualizar_tamaño()
+        
         # Retornar nueva raíz
         return x
     
@@ -362,5 +612,9 @@ class ArbolAVLObstaculos:
         altura_der_y = y.derecho.altura if y.derecho else 0
         y.altura = 1 + max(altura_izq_y, altura_der_y)
         
+        # Actualizar tamaños (primero el nodo que quedó abajo)
+        x.actualizar_tamaño()
+        y.actualizar_tamaño()
+        
         # Retornar nueva raíz
         return y
\ No newline at end of file
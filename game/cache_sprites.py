@@ -0,0 +1,39 @@
+import pygame
+
+class CacheSprites:
+    """Sprites del carrito y los obstáculos, ya girados a la orientación de pantalla.
+
+    Cada variante (tipo de obstáculo o estado del carrito) se rasteriza una sola
+    vez por tamaño en una superficie con alfa por pixel. Cuando cambia la escala
+    de la ventana se descartan todas, porque ningún tamaño anterior se reutiliza.
+    """
+    # Margen alrededor de cada entidad: algunos detalles (faros) se salen un poco de su rect
+    MARGEN = 4
+
+    def __init__(self):
+        self.sprites = {}
+        self.escala = None
+
+    def ajustar_escala(self, escala):
+        """Vacía la caché si la escala (tamaño de la ventana) cambió"""
+        if escala != self.escala:
+            self.sprites.clear()
+            self.escala = escala
+
+    def obtener(self, entidad, ancho, alto):
+        """Retorna el sprite girado de la entidad para un rect del mundo de ancho x alto"""
+        clave = (entidad.clave_sprite(), ancho, alto)
+        sprite = self.sprites.get(clave)
+        if sprite is None:
+            sprite = self.rasterizar(entidad, ancho, alto)
+            self.sprites[clave] = sprite
+        return sprite
+
+    def rasterizar(self, entidad, ancho, alto):
+        margen = self.MARGEN
+        sprite = pygame.Surface((ancho + 2 * margen, alto + 2 * margen), pygame.SRCALPHA)
+        entidad.dibujar_forma(sprite, pygame.Rect(margen, margen, ancho, alto))
+        sprite = pygame.transform.rotate(sprite, -90)
+        if pygame.display.get_surface() is not None:
+            sprite = sprite.convert_alpha()
+        return sprite
@@ -0,0 +1,39 @@
+from collections import OrderedDict
+
+class CacheTextos:
+    """Caché LRU acotada de textos ya renderizados, por (fuente, texto, color).
+
+    Casi ningún texto del HUD o del árbol cambia entre cuadros, así que cada uno
+    se renderiza una vez y luego solo se copia. Los valores numéricos se pasan
+    ya formateados (por ejemplo con un decimal), de modo que un valor que cambia
+    poco a poco reutiliza la misma superficie mientras su texto no cambie.
+    """
+    def __init__(self, capacidad=256):
+        self.capacidad = capacidad
+        self.superficies = OrderedDict()
+        self.aciertos = 0
+        self.fallos = 0
+
+    def renderizar(self, fuente, texto, color):
+        """Equivale a fuente.render(texto, True, color); la superficie no se debe modificar"""
+        clave = (fuente, texto, color)
+        superficie = self.superficies.get(clave)
+        if superficie is not None:
+            self.aciertos += 1
+            self.superficies.move_to_end(clave)
+            return superficie
+        self.fallos += 1
+        superficie = fuente.render(texto, True, color)
+        self.superficies[clave] = superficie
+        if len(self.superficies) > self.capacidad:
+            self.superficies.popitem(last=False)
+        return superficie
+
+    def tasa_aciertos(self):
+        total = self.aciertos + self.fallos
+        return self.aciertos / total if total else 0.0
+
+    def limpiar(self):
+        self.superficies.clear()
+        self.aciertos = 0
+        self.fallos = 0
@@ -8,11 +8,12 @@ class Carretera:
         self.ancho_carril = ancho // self.carriles
         self.linea_posicion = 0
         self.velocidad_linea = 3
+        # Tira con las líneas de carril pre-dibujada, una por tamaño de ventana
+        self.capa = None
+        self.tamaño_capa = None
         
-    def actualizar(self):
-        self.linea_posicion += self.velocidad_linea
-        if self.linea_posicion >= 40:
-            self.linea_posicion = 0
+    def actualizar(self, velocidad=1.0):
+        self.linea_posicion = (self.linea_posicion + self.velocidad_linea * velocidad) % 40
             
     def dibujar(self, pantalla, ancho, alto):
         self.ancho = ancho
@@ -21,7 +22,7 @@ class Carretera:
         pantalla.fill((50, 50, 50))
         for i in range(1, self.carriles):
             x = i * self.ancho_carril
-            for y in range(-20 + self.linea_posicion, alto + 20, 40):
+            for y in range(-20 + int(self.linea_posicion), alto + 20, 40):
                 pygame.draw.rect(pantalla, (255, 255, 255), (x - 2, y, 4, 20))
         pygame.draw.rect(pantalla, (255, 255, 255), (0, 0, 4, alto))
         pygame.draw.rect(pantalla, (255, 255, 255), (ancho - 4, 0, 4, alto))
@@ -37,6 +38,37 @@ class Carretera:
                 pygame.draw.rect(pantalla, (255, 255, 255), (x - 2, y, 4, 20))
         pygame.draw.rect(pantalla, (255, 255, 255), (0, 0, 4, alto))
         pygame.draw.rect(pantalla, (255, 255, 255), (ancho - 4, 0, 4, alto))
+
+    def dibujar_horizontal(self, pantalla, ancho, alto):
+        """Dibuja la carretera en la pantalla horizontal de ancho x alto.
+
+        Las líneas de carril salen de una tira pre-dibujada que se copia con un
+        blit por línea, desplazada según linea_posicion igual que en dibujar.
+        """
+        self.ancho = alto
+        self.alto = ancho
+        self.ancho_carril = alto // self.carriles
+        if self.tamaño_capa != (ancho, alto):
+            self._prerenderizar(pantalla, ancho, alto)
+        desplazamiento = (int(self.linea_posicion) - ancho) % 40
+        pantalla.fill((50, 50, 50))
+        for i in range(1, self.carriles):
+            pantalla.blit(self.capa, (0, i * self.ancho_carril - 2), (desplazamiento, 0, ancho, 4))
+        pantalla.fill((255, 255, 255), (0, 0, ancho, 4))
+        pantalla.fill((255, 255, 255), (0, alto - 4, ancho, 4))
+
+    def rects_lineas(self, ancho, alto):
+        """Rects de pantalla de las líneas de carril, que cambian al desplazarse"""
+        ancho_carril = alto // self.carriles
+        return [pygame.Rect(0, i * ancho_carril - 2, ancho, 4) for i in range(1, self.carriles)]
+
+    def _prerenderizar(self, pantalla, ancho, alto):
+        # Tira de una línea de carril, un período (40 px) más larga que la ventana para desplazarla
+        self.capa = pygame.Surface((ancho + 40, 4), 0, pantalla)
+        self.tamaño_capa = (ancho, alto)
+        self.capa.fill((50, 50, 50))
+        for x in range(0, ancho + 40, 40):
+            self.capa.fill((255, 255, 255), (x, 0, 20, 4))
                 
     def obtener_carril_centro(self, numero_carril):
         if 0 <= numero_carril < self.carriles:
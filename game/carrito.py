@@ -11,8 +11,14 @@ class Carrito:
         self.energia_maxima = 100
         self.energia_actual = 100
         self.saltando = False
+        # Milisegundos de simulación transcurridos desde que empezó el salto
         self.tiempo_salto = 0
         self.duracion_salto = 800
+        # Posición al inicio del último paso de simulación y fracción del paso siguiente
+        # ya transcurrida, para interpolar el dibujo entre pasos
+        self.y_anterior = y
+        self.alfa_dibujo = 1.0
+        self.rect_colision = pygame.Rect(0, 0, 0, 0)
         
     def mover_arriba(self):
         self.x -= self.velocidad
@@ -22,6 +28,13 @@ class Carrito:
         
     def obtener_rect(self):
         return pygame.Rect(self.x, self.y, self.ancho, self.alto)
+
+    def obtener_rect_colision(self):
+        """Rect reducido para colisiones, actualizado en el mismo objeto en cada llamada"""
+        rect = self.rect_colision
+        rect.update(self.x, self.y, self.ancho, self.alto)
+        rect.update(rect.x + 2, rect.y + 2, rect.width - 4, rect.height - 4)
+        return rect
         
     def reducir_energia(self, cantidad):
         self.energia_actual = max(0, self.energia_actual - cantidad)
@@ -33,25 +46,35 @@ class Carrito:
     def saltar(self):
         if not self.saltando:
             self.saltando = True
-            self.tiempo_salto = pygame.time.get_ticks()
+            self.tiempo_salto = 0
             
-    def actualizar_salto(self):
+    def actualizar_salto(self, milisegundos):
+        """Avanza el salto según el tiempo de simulación, no el reloj real"""
         if self.saltando:
-            tiempo_actual = pygame.time.get_ticks()
-            if tiempo_actual - self.tiempo_salto >= self.duracion_salto:
+            self.tiempo_salto += milisegundos
+            if self.tiempo_salto >= self.duracion_salto:
                 self.saltando = False
                 
     def esta_saltando(self):
         return self.saltando
         
-    def dibujar(self, pantalla, ancho, alto):
+    def obtener_rect_dibujo(self, ancho, alto):
+        """Rect que ocupa el carrito en una superficie del mundo de ancho x alto"""
         escala_x = ancho / 800
         escala_y = alto / 600
-        x = int(self.x * escala_x)
-        y = int(self.y * escala_y)
-        w = int(self.ancho * escala_x)
-        h = int(self.alto * escala_y)
-        self._dibujar_carro(pantalla, x, y, w, h)
+        y = self.y - (self.y - self.y_anterior) * (1 - self.alfa_dibujo)
+        return pygame.Rect(int(self.x * escala_x), int(y * escala_y),
+                           int(self.ancho * escala_x), int(self.alto * escala_y))
+
+    def dibujar(self, pantalla, ancho, alto):
+        self.dibujar_forma(pantalla, self.obtener_rect_dibujo(ancho, alto))
+
+    def clave_sprite(self):
+        """Variante de dibujo: el carrito solo cambia de aspecto al saltar"""
+        return ('carrito', self.saltando)
+
+    def dibujar_forma(self, superficie, rect):
+        self._dibujar_carro(superficie, rect.x, rect.y, rect.width, rect.height)
         
     def _dibujar_carro(self, pantalla, x, y, w, h):
         if self.saltando:
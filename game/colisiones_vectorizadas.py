@@ -0,0 +1,107 @@
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from .obstaculo import Obstaculo
+
+class ColisionesVectorizadas:
+    """Detección de colisiones AABB vectorizada con NumPy.
+
+    Mantiene en arreglos los rectángulos de colisión y el estado activo de
+    todos los obstáculos del árbol (en orden de distancia) y prueba el
+    rectángulo del carrito en una sola operación por cuadro. Como la y en
+    pantalla baja a medida que crece la distancia, una búsqueda binaria sobre
+    y acota la prueba a los obstáculos a la altura del carrito.
+    Conviene en niveles con miles de obstáculos visibles a la vez.
+
+    Al podar obstáculos pasados el árbol pierde un prefijo de distancias; podar
+    recorta ese mismo prefijo de los arreglos sin volver a copiarlos.
+    """
+    def __init__(self):
+        if np is None:
+            raise ImportError("ColisionesVectorizadas requiere numpy")
+        self.arbol = None
+        self.version_arbol = None
+        self.obstaculos = []
+        self.distancias = np.empty(0, dtype=np.float64)
+        self.x1 = self.x2 = self.y1 = self.y2 = self.menos_y1 = np.empty(0, dtype=np.int64)
+        self.ordenados_y = True
+        self.activos = np.empty(0, dtype=bool)
+
+    def invalidar(self):
+        """Fuerza a copiar de nuevo las posiciones (por ejemplo, tras recalcular carriles)"""
+        self.arbol = None
+
+    def sincronizar(self, arbol):
+        """Copia a los arreglos los rectángulos de colisión de los obstáculos del árbol"""
+        self.arbol = arbol
+        self.version_arbol = arbol.version
+        self.obstaculos = arbol.obtener_obstaculos_ordenados()
+        cantidad = len(self.obstaculos)
+        self.distancias = np.fromiter((obstaculo.x_original for obstaculo in self.obstaculos),
+                                      dtype=np.float64, count=cantidad)
+        # Mismo rect que Obstaculo.obtener_rect_colision (pygame.Rect trunca hacia cero), sin crearlo
+        self.x1 = np.trunc(np.fromiter((obstaculo.x for obstaculo in self.obstaculos),
+                                       dtype=np.float64, count=cantidad)).astype(np.int64) + 2
+        self.y1 = np.trunc(np.fromiter((obstaculo.y for obstaculo in self.obstaculos),
+                                       dtype=np.float64, count=cantidad)).astype(np.int64) + 2
+        self.x2 = self.x1 + (Obstaculo.ancho - 4)
+        self.y2 = self.y1 + (Obstaculo.alto - 4)
+        # -y1 crece con la distancia; si algún obstáculo se movió y no es así, se prueban todos
+        self.menos_y1 = -self.y1
+        self.ordenados_y = bool(np.all(self.menos_y1[1:] >= self.menos_y1[:-1]))
+        # Un rect sin área nunca colisiona en pygame; se trata como inactivo
+        self.activos = np.fromiter((obstaculo.activo for obstaculo in self.obstaculos), dtype=bool,
+                                   count=cantidad)
+        if Obstaculo.ancho <= 4 or Obstaculo.alto <= 4:
+            self.activos[:] = False
+
+    def podar(self, arbol, version_previa, distancia_limite):
+        """Quita de los arreglos los obstáculos con distancia <= distancia_limite.
+
+        El motor la llama después de arbol.eliminar_rango(-inf, distancia_limite).
+        Si los arreglos no estaban al día con version_previa no hace nada, y el
+        próximo detectar sincroniza completo.
+        """
+        if arbol is not self.arbol or version_previa != self.version_arbol:
+            return
+        fin = int(np.searchsorted(self.distancias, distancia_limite, side='right'))
+        # Los cortes de numpy son vistas: no se copian los arreglos
+        del self.obstaculos[:fin]
+        self.distancias = self.distancias[fin:]
+        self.x1 = self.x1[fin:]
+        self.x2 = self.x2[fin:]
+        self.y1 = self.y1[fin:]
+        self.y2 = self.y2[fin:]
+        self.menos_y1 = self.menos_y1[fin:]
+        self.activos = self.activos[fin:]
+        self.version_arbol = arbol.version
+
+    def detectar(self, arbol, rect_carrito):
+        """Retorna, en orden de distancia, los obstáculos activos que tocan rect_carrito.
+
+        Equivale a verificar_colision sobre cada obstáculo. Los obstáculos
+        retornados quedan marcados como inactivos en los arreglos, porque el
+        motor los desactiva al chocar.
+        """
+        if arbol is not self.arbol or arbol.version != self.version_arbol:
+            self.sincronizar(arbol)
+        if rect_carrito.width <= 0 or rect_carrito.height <= 0:
+            return []
+        if self.ordenados_y:
+            # Solo pueden tocar al carrito los que cumplen rect.y - alto < y1 < rect.bottom
+            inicio = int(np.searchsorted(self.menos_y1, -rect_carrito.bottom, side='right'))
+            fin = int(np.searchsorted(self.menos_y1, Obstaculo.alto - 4 - rect_carrito.y, side='left'))
+        else:
+            inicio, fin = 0, len(self.obstaculos)
+        if inicio >= fin:
+            return []
+        golpes = np.flatnonzero(self.activos[inicio:fin]
+                                & (self.x1[inicio:fin] < rect_carrito.right) & (self.x2[inicio:fin] > rect_carrito.x)
+                                & (self.y1[inicio:fin] < rect_carrito.bottom) & (self.y2[inicio:fin] > rect_carrito.y))
+        if not len(golpes):
+            return []
+        golpes += inicio
+        self.activos[golpes] = False
+        return [self.obstaculos[indice] for indice in golpes]
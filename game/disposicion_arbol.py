@@ -0,0 +1,136 @@
+class DisposicionArbol:
+    """Disposición ordenada (Reingold–Tilford) de un árbol binario.
+
+    Cada subárbol se acomoda con su raíz en x = 0 y guarda sus contornos: la x
+    mínima y la máxima de cada nivel. Al subir a un padre, el subárbol derecho
+    se aleja del izquierdo lo justo para que en ningún nivel común queden a
+    menos de una unidad, y el padre se centra entre los dos. Un hijo único se
+    corre media unidad hacia su lado, para que se vea si es izquierdo o derecho.
+
+    Los contornos de cada nodo se guardan junto con los hijos que tenía. En la
+    siguiente disposición solo se rehacen los nodos cuyos hijos cambiaron y sus
+    ancestros; tras una inserción, eliminación o rotación, ese es el camino
+    tocado. Rehacer un nodo cuesta lo que mide su altura, y en un árbol AVL la
+    suma de las alturas es lineal en la cantidad de nodos.
+
+    El mínimo y el máximo de los contornos dan la caja de cada subárbol, así
+    que el mismo árbol sirve de índice espacial para saber qué se ve.
+    """
+    def __init__(self):
+        # nodo -> (izquierdo, derecho, contorno izquierdo, contorno derecho, desplazamiento de los hijos,
+        #          x mínima, x máxima)
+        self.subarboles = {}
+
+    def acomodar(self, raiz):
+        """Rehace la disposición relativa; retorna la x mínima y máxima en unidades, con la raíz en 0"""
+        if raiz is None:
+            self.subarboles = {}
+            return 0, 0
+
+        # Preorden con pila explícita; al revés, cada nodo queda después de sus hijos
+        orden = []
+        pila = [raiz]
+        while pila:
+            nodo = pila.pop()
+            izquierdo, derecho = nodo.izquierdo, nodo.derecho
+            orden.append((nodo, izquierdo, derecho))
+            if derecho is not None:
+                pila.append(derecho)
+            if izquierdo is not None:
+                pila.append(izquierdo)
+
+        anteriores = self.subarboles
+        subarboles = {}
+        for nodo, izquierdo, derecho in reversed(orden):
+            sub_izquierdo = subarboles.get(izquierdo) if izquierdo is not None else None
+            sub_derecho = subarboles.get(derecho) if derecho is not None else None
+            anterior = anteriores.get(nodo)
+            # Se reutiliza si tiene los mismos hijos y ninguno de ellos se rehízo
+            if (anterior is not None and anterior[0] == izquierdo and anterior[1] == derecho
+                    and (izquierdo is None or sub_izquierdo is anteriores.get(izquierdo))
+                    and (derecho is None or sub_derecho is anteriores.get(derecho))):
+                subarboles[nodo] = anterior
+            else:
+                subarboles[nodo] = self._combinar(izquierdo, derecho, sub_izquierdo, sub_derecho)
+        self.subarboles = subarboles
+
+        return subarboles[raiz][5], subarboles[raiz][6]
+
+    def ubicar(self, raiz, x_raiz, y_raiz, unidad, espacio_vertical):
+        """Posiciones {nodo: (x, y)} de la última disposición, con cada unidad medida en `unidad`"""
+        posiciones = {}
+        if raiz is None:
+            return posiciones
+        subarboles = self.subarboles
+        # Preorden, izquierdo primero
+        pila = [(raiz, x_raiz, y_raiz)]
+        while pila:
+            nodo, x, y = pila.pop()
+            posiciones[nodo] = (round(x), y)
+            izquierdo, derecho, _, _, desplazamiento, _, _ = subarboles[nodo]
+            desplazamiento *= unidad
+            if derecho is not None:
+                pila.append((derecho, x + desplazamiento, y + espacio_vertical))
+            if izquierdo is not None:
+                pila.append((izquierdo, x - desplazamiento, y + espacio_vertical))
+        return posiciones
+
+    def en_vista(self, raiz, posiciones, unidad, espacio_vertical, vista, ancho_resumen=0):
+        """Genera (nodo, izquierdo, derecho, resumen) de cada subárbol cuya caja toca la vista.
+
+        vista es (x mínima, y mínima, x máxima, y máxima) en las coordenadas de
+        posiciones. Un subárbol fuera de la vista se descarta sin bajar por él.
+        Uno con hijos y más angosto que ancho_resumen tampoco se recorre: se
+        entrega con resumen = (x mínima, x máxima, y máxima) de su caja.
+        """
+        if raiz is None:
+            return
+        vista_x_min, vista_y_min, vista_x_max, vista_y_max = vista
+        subarboles = self.subarboles
+        # Preorden, izquierdo primero
+        pila = [raiz]
+        while pila:
+            nodo = pila.pop()
+            x, y = posiciones[nodo]
+            izquierdo, derecho, contorno, _, _, minimo, maximo = subarboles[nodo]
+            x_min = x + minimo * unidad
+            x_max = x + maximo * unidad
+            y_max = y + (len(contorno) - 1) * espacio_vertical
+            if x_max < vista_x_min or x_min > vista_x_max or y_max < vista_y_min or y > vista_y_max:
+                continue
+            if x_max - x_min < ancho_resumen and (izquierdo is not None or derecho is not None):
+                yield nodo, izquierdo, derecho, (x_min, x_max, y_max)
+                continue
+            yield nodo, izquierdo, derecho, None
+            if derecho is not None:
+                pila.append(derecho)
+            if izquierdo is not None:
+                pila.append(izquierdo)
+
+    def _combinar(self, izquierdo, derecho, sub_izquierdo, sub_derecho):
+        """Acomoda un nodo sobre los subárboles ya acomodados de sus hijos"""
+        if sub_izquierdo is None and sub_derecho is None:
+            return (izquierdo, derecho, [0], [0], 0, 0, 0)
+
+        if sub_derecho is None:
+            desplazamiento = 0.5
+            contorno_izquierdo = [0] + [x - desplazamiento for x in sub_izquierdo[2]]
+            contorno_derecho = [0] + [x - desplazamiento for x in sub_izquierdo[3]]
+        elif sub_izquierdo is None:
+            desplazamiento = 0.5
+            contorno_izquierdo = [0] + [x + desplazamiento for x in sub_derecho[2]]
+            contorno_derecho = [0] + [x + desplazamiento for x in sub_derecho[3]]
+        else:
+            izquierdo_de_izq, derecho_de_izq = sub_izquierdo[2], sub_izquierdo[3]
+            izquierdo_de_der, derecho_de_der = sub_derecho[2], sub_derecho[3]
+            # Separación mínima entre las raíces para que ningún nivel común se acerque a menos de una unidad
+            separacion = max(a - b for a, b in zip(derecho_de_izq, izquierdo_de_der)) + 1
+            desplazamiento = separacion / 2
+            # Cada contorno sale del subárbol de su lado y sigue con el otro donde el primero ya terminó
+            contorno_izquierdo = ([0] + [x - desplazamiento for x in izquierdo_de_izq]
+                                  + [x + desplazamiento for x in izquierdo_de_der[len(izquierdo_de_izq):]])
+            contorno_derecho = ([0] + [x + desplazamiento for x in derecho_de_der]
+                                + [x - desplazamiento for x in derecho_de_izq[len(derecho_de_der):]])
+
+        return (izquierdo, derecho, contorno_izquierdo, contorno_derecho, desplazamiento,
+                min(contorno_izquierdo), max(contorno_derecho))
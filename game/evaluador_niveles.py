@@ -0,0 +1,206 @@
+"""Evalúa en lote niveles de obstáculos con varias políticas de entrada.
+
+Cada nivel es un archivo JSON con el mismo formato que obstaculos.json. Cada
+combinación (nivel, política) se simula sin ventana en un proceso del pool, y
+cada proceso lee y guarda cada nivel una sola vez. Por corrida se reporta la
+distancia recorrida, si sobrevivió, los choques y la curva de energía
+muestreada. Un nivel que no se puede leer o no tiene esa forma da una fila
+con solo la columna error.
+
+Uso: python -m game.evaluador_niveles DIRECTORIO [--politicas esquivar,aleatoria]
+     [--cuadros 7200] [--procesos N] [--formato csv|json] [--salida archivo]
+"""
+import argparse
+import contextlib
+import csv
+import functools
+import io
+import json
+import os
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import pygame
+
+from .simulacion_sin_ventana import SimulacionSinVentana
+
+# Distancia por delante del carrito en la que la política de esquivar reacciona
+HORIZONTE_ESQUIVAR = 60
+
+
+def politica_nada(semilla):
+    return lambda motor, cuadro: ()
+
+
+def politica_siempre_salta(semilla):
+    def decidir(motor, cuadro):
+        return () if motor.carrito.esta_saltando() else (pygame.K_SPACE,)
+    return decidir
+
+
+def politica_esquivar(semilla):
+    """Cambia a un carril libre si hay un obstáculo adelante; si no hay ninguno libre, salta"""
+    def decidir(motor, cuadro):
+        distancia = motor.distancia_carrito()
+        # Un obstáculo toca al carrito con distancias en (distancia - alto carrito, distancia + alto obstáculo)
+        ocupados = {nodo.y for nodo in motor.arbol_obstaculos.rango(distancia - motor.carrito.alto,
+                                                                     distancia + 40 + HORIZONTE_ESQUIVAR)
+                    if nodo.obstaculo.activo}
+        if motor.carril_actual not in ocupados:
+            return ()
+        for carril, tecla in ((motor.carril_actual - 1, pygame.K_UP), (motor.carril_actual + 1, pygame.K_DOWN)):
+            if 0 <= carril < motor.total_carriles and carril not in ocupados:
+                return (tecla,)
+        return () if motor.carrito.esta_saltando() else (pygame.K_SPACE,)
+    return decidir
+
+
+def politica_aleatoria(semilla):
+    aleatorio = random.Random(semilla)
+    teclas = (pygame.K_UP, pygame.K_DOWN, pygame.K_SPACE)
+
+    def decidir(motor, cuadro):
+        if aleatorio.random() < 0.05:
+            return (aleatorio.choice(teclas),)
+        return ()
+    return decidir
+
+
+POLITICAS = {
+    'nada': politica_nada,
+    'siempre_salta': politica_siempre_salta,
+    'esquivar': politica_esquivar,
+    'aleatoria': politica_aleatoria
+}
+
+CAMPOS = ('nivel', 'politica', 'semilla', 'cuadros', 'sobrevivio', 'distancia', 'energia_final',
+          'colisiones', 'obstaculos_saltados', 'curva_energia', 'error')
+
+
+@functools.lru_cache(maxsize=None)
+def _cargar_nivel(ruta):
+    with open(ruta, 'r', encoding='utf-8') as archivo:
+        nivel = json.load(archivo)
+    _validar_nivel(nivel)
+    return nivel
+
+
+def _validar_nivel(nivel):
+    """Lanza ValueError si el nivel no es una lista de obstáculos con x, y numéricos y tipo.
+
+    El motor atrapa cualquier error al cargar y solo lo imprime, así que un
+    nivel con otra forma correría sin obstáculos en vez de dar una fila de error.
+    """
+    if not isinstance(nivel, list):
+        raise ValueError(f"el nivel debe ser una lista de obstáculos, no {type(nivel).__name__}")
+    for indice, obstaculo in enumerate(nivel):
+        if not isinstance(obstaculo, dict):
+            raise ValueError(f"obstáculo {indice}: debe ser un objeto, no {type(obstaculo).__name__}")
+        faltantes = [campo for campo in ('x', 'y', 'tipo') if campo not in obstaculo]
+        if faltantes:
+            raise ValueError(f"obstáculo {indice}: faltan {', '.join(faltantes)}")
+        for campo in ('x', 'y'):
+            valor = obstaculo[campo]
+            if isinstance(valor, bool) or not isinstance(valor, (int, float)):
+                raise ValueError(f"obstáculo {indice}: {campo} debe ser un número, no {valor!r}")
+
+
+def evaluar(tarea):
+    """Simula una política sobre un nivel; corre dentro de un proceso del pool"""
+    ruta, politica, semilla, cuadros, muestreo = tarea
+    resultado = {'nivel': os.path.basename(ruta), 'politica': politica, 'semilla': semilla}
+    try:
+        nivel = _cargar_nivel(ruta)
+    except (OSError, ValueError) as e:
+        resultado['error'] = str(e)
+        return resultado
+    with contextlib.redirect_stdout(io.StringIO()):
+        simulacion = SimulacionSinVentana(POLITICAS[politica](semilla), nivel=nivel)
+    motor = simulacion.motor
+    curva = [motor.carrito.energia_actual]
+    while simulacion.cuadro < cuadros and motor.juego_activo:
+        simulacion.paso()
+        if simulacion.cuadro % muestreo == 0 or not motor.juego_activo:
+            curva.append(motor.carrito.energia_actual)
+    resultado.update({
+        'cuadros': simulacion.cuadro,
+        'sobrevivio': motor.juego_activo,
+        'distancia': round(motor.distancia_recorrida, 1),
+        'energia_final': motor.carrito.energia_actual,
+        'colisiones': motor.colisiones,
+        'obstaculos_saltados': motor.obstaculos_saltados,
+        'curva_energia': curva
+    })
+    return resultado
+
+
+def evaluar_lote(rutas, politicas, cuadros=7200, muestreo=60, semilla=0, procesos=None):
+    """Evalúa cada nivel con cada política; retorna los resultados en el orden de las tareas"""
+    tareas = [(ruta, politica, semilla, cuadros, muestreo) for ruta in rutas for politica in politicas]
+    procesos = procesos or os.cpu_count() or 1
+    if procesos == 1:
+        return [evaluar(tarea) for tarea in tareas]
+    with ProcessPoolExecutor(max_workers=procesos) as pool:
+        return list(pool.map(evaluar, tareas, chunksize=max(1, len(tareas) // (procesos * 4))))
+
+
+def escribir(resultados, formato, salida):
+    if formato == 'json':
+        json.dump(resultados, salida, ensure_ascii=False, indent=2)
+        salida.write("\n")
+        return
+    escritor = csv.DictWriter(salida, fieldnames=CAMPOS)
+    escritor.writeheader()
+    for resultado in resultados:
+        fila = dict(resultado)
+        if 'curva_energia' in fila:
+            fila['curva_energia'] = ";".join(map(str, fila['curva_energia']))
+        escritor.writerow(fila)
+
+
+def main(argumentos=None):
+    parser = argparse.ArgumentParser(prog="python -m game.evaluador_niveles",
+                                     description="Evalúa niveles de obstáculos con políticas de entrada.")
+    parser.add_argument("directorio", help="directorio con los niveles en JSON")
+    parser.add_argument("--politicas", default=",".join(POLITICAS),
+                        help=f"lista separada por comas; disponibles: {', '.join(POLITICAS)}")
+    parser.add_argument("--cuadros", type=int, default=7200, help="máximo de cuadros por corrida")
+    parser.add_argument("--muestreo", type=int, default=60, help="cuadros entre muestras de energía")
+    parser.add_argument("--semilla", type=int, default=0, help="semilla de la política aleatoria")
+    parser.add_argument("--procesos", type=int, default=None, help="procesos del pool (por omisión, uno por núcleo)")
+    parser.add_argument("--formato", choices=("csv", "json"), default="csv")
+    parser.add_argument("--salida", default=None, help="archivo de salida (por omisión, la salida estándar)")
+    opciones = parser.parse_args(argumentos)
+
+    politicas = [nombre.strip() for nombre in opciones.politicas.split(",") if nombre.strip()]
+    desconocidas = [nombre for nombre in politicas if nombre not in POLITICAS]
+    if desconocidas:
+        parser.error(f"políticas desconocidas: {', '.join(desconocidas)}")
+    rutas = sorted(os.path.join(opciones.directorio, nombre) for nombre in os.listdir(opciones.directorio)
+                   if nombre.endswith(".json"))
+    if not rutas:
+        print(f"No hay niveles .json en {opciones.directorio}", file=sys.stderr)
+        return 1
+
+    inicio = time.perf_counter()
+    resultados = evaluar_lote(rutas, politicas, opciones.cuadros, opciones.muestreo,
+                              opciones.semilla, opciones.procesos)
+    total = time.perf_counter() - inicio
+    pasos = sum(resultado.get('cuadros', 0) for resultado in resultados)
+    print(f"{len(resultados)} corridas, {pasos} cuadros en {total:.2f} s ({pasos / total:.0f} cuadros/s)",
+          file=sys.stderr)
+
+    if opciones.salida:
+        with open(opciones.salida, 'w', encoding='utf-8', newline='') as salida:
+            escribir(resultados, opciones.formato, salida)
+    else:
+        escribir(resultados, opciones.formato, sys.stdout)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,7 +1,10 @@
 import pygame
+from game.orientacion import rect_a_pantalla
+from game.cache_sprites import CacheSprites
+from game.cache_textos import CacheTextos
 
 class GUI:
-    def __init__(self):
+    def __init__(self, rectangulos_sucios=False):
         self.ancho_pantalla = 900
         self.alto_pantalla = 600
         self.pantalla = pygame.display.set_mode((self.ancho_pantalla, self.alto_pantalla), pygame.RESIZABLE)
@@ -16,6 +19,14 @@ class GUI:
         self.VERDE = (0, 255, 0)
         self.AZUL = (0, 0, 255)
         self.NARANJA = (255, 140, 0)
+        # Superficies reutilizadas entre cuadros; se recrean solo si cambia el tamaño de la ventana
+        self.tamaño_superficies = None
+        self.velos = {}
+        self.cache_sprites = CacheSprites()
+        self.cache_textos = CacheTextos(128)
+        # Modo opcional: repintar y enviar a la ventana solo los rects que cambiaron
+        self.rectangulos_sucios = rectangulos_sucios
+        self.estado_sucios = None
 
     def get_size(self):
         return self.pantalla.get_size()
@@ -24,39 +35,124 @@ class GUI:
         ancho, alto = self.get_size()
         motor.ancho_pantalla = ancho
         motor.alto_pantalla = alto
-        superficie_juego = pygame.Surface((alto, ancho))
+        if (ancho, alto) != self.tamaño_superficies:
+            self._reasignar_superficies(ancho, alto)
+        if self.rectangulos_sucios and motor.juego_activo and not motor.mostrar_arbol:
+            self._renderizar_sucios(motor, ancho, alto)
+            return
+        # Cualquier cuadro completo obliga a empezar de nuevo el modo de rects sucios
+        self.estado_sucios = None
         
+        # El mundo se dibuja ya girado: sin superficie intermedia ni rotar/escalar el cuadro completo
         if motor.juego_activo:
-            motor.carretera.dibujar_estatica(superficie_juego, alto, ancho)
-            motor.carrito.dibujar(superficie_juego, alto, ancho)
+            motor.carretera.dibujar_horizontal(self.pantalla, ancho, alto)
+            self._dibujar_entidad(motor.carrito, ancho, alto)
             for obstaculo in motor.obstaculos:
-                obstaculo.dibujar(superficie_juego, alto, ancho)
+                if obstaculo.activo:
+                    self._dibujar_entidad(obstaculo, ancho, alto)
         else:
-            superficie_juego.fill(self.NEGRO)
-            
-        superficie_rotada = pygame.transform.rotate(superficie_juego, -90)
-        superficie_escalada = pygame.transform.scale(superficie_rotada, (ancho, alto))
-        self.pantalla.fill(self.NEGRO)
-        self.pantalla.blit(superficie_escalada, (0, 0))
+            self.pantalla.fill(self.NEGRO)
         
         if motor.juego_activo:
-            self.mostrar_velocidad(motor.velocidad_juego)
-            self.mostrar_velocidad_carrito(motor.velocidad_carrito_x)
-            self.mostrar_energia(motor.carrito)
-            self.mostrar_controles_arbol(motor)
+            self._dibujar_hud(motor)
             if motor.mostrar_arbol:
                 self.mostrar_arbol_avl(motor)
         else:
             self.mostrar_game_over()
         pygame.display.flip()
+
+    def _renderizar_sucios(self, motor, ancho, alto):
+        """Repinta solo lo que cambió desde el cuadro anterior y lo envía con display.update.
+
+        Los obstáculos no se mueven en pantalla: solo ensucian su rect cuando
+        aparecen o desaparecen. El carrito, el HUD y las líneas de carril (que
+        se desplazan) se repintan en cada cuadro.
+        """
+        carretera = motor.carretera
+        obstaculos = [obstaculo for obstaculo in motor.obstaculos if obstaculo.activo]
+        rects_obstaculos = [self._ubicar_entidad(obstaculo, ancho, alto)[1] for obstaculo in obstaculos]
+        actuales = set(map(tuple, rects_obstaculos))
+        rect_carrito = self._ubicar_entidad(motor.carrito, ancho, alto)[1]
+
+        if self.estado_sucios is None:
+            carretera.dibujar_horizontal(self.pantalla, ancho, alto)
+            self._dibujar_entidad(motor.carrito, ancho, alto)
+            for obstaculo in obstaculos:
+                self._dibujar_entidad(obstaculo, ancho, alto)
+            sucios = None
+        else:
+            previos, fijos_previos = self.estado_sucios
+            sucios = [pygame.Rect(rect) for rect in previos ^ actuales]
+            sucios.extend(fijos_previos)
+            sucios.append(rect_carrito)
+            sucios.extend(carretera.rects_lineas(ancho, alto))
+            # Cada rect sucio se repinta completo y recortado, en el mismo orden que el cuadro
+            # completo: así un obstáculo no pisa fuera del rect a un vecino que no se repintó
+            for rect in sucios:
+                self.pantalla.set_clip(rect)
+                carretera.dibujar_horizontal(self.pantalla, ancho, alto)
+                if rect.colliderect(rect_carrito):
+                    self._dibujar_entidad(motor.carrito, ancho, alto)
+                for i in rect.collidelistall(rects_obstaculos):
+                    self._dibujar_entidad(obstaculos[i], ancho, alto)
+            self.pantalla.set_clip(None)
+
+        rects_hud = self._dibujar_hud(motor)
+
+        self.estado_sucios = (actuales, [rect_carrito] + rects_hud)
+        if sucios is None:
+            pygame.display.flip()
+        else:
+            pygame.display.update(sucios + rects_hud)
+
+    def _dibujar_hud(self, motor):
+        """Dibuja los indicadores del juego y retorna los rects que ocupan"""
+        return [
+            self.mostrar_velocidad(motor.velocidad_juego),
+            self.mostrar_velocidad_carrito(motor.velocidad_carrito_x),
+            self.mostrar_energia(motor.carrito),
+            self.mostrar_obstaculos_adelante(motor),
+            self.mostrar_controles_arbol(motor)
+        ]
      
+    def _reasignar_superficies(self, ancho, alto):
+        self.tamaño_superficies = (ancho, alto)
+        self.velos.clear()
+        self.estado_sucios = None
+        self.cache_sprites.ajustar_escala((ancho, alto))
+
+    def _obtener_velo(self, ancho, alto, alpha):
+        """Superficie negra semitransparente, creada una sola vez por tamaño"""
+        clave = (ancho, alto, alpha)
+        velo = self.velos.get(clave)
+        if velo is None:
+            velo = pygame.Surface((ancho, alto))
+            velo.set_alpha(alpha)
+            velo.fill(self.NEGRO)
+            self.velos[clave] = velo
+        return velo
+
+    def _ubicar_entidad(self, entidad, ancho, alto):
+        """Retorna el sprite girado de una entidad y el rect de pantalla donde va"""
+        rect = entidad.obtener_rect_dibujo(alto, ancho)
+        sprite = self.cache_sprites.obtener(entidad, rect.width, rect.height)
+        margen = self.cache_sprites.MARGEN
+        destino = pygame.Rect(rect_a_pantalla(rect.x - margen, rect.y - margen,
+                                              rect.width + 2 * margen, rect.height + 2 * margen, ancho))
+        return sprite, destino
+
+    def _dibujar_entidad(self, entidad, ancho, alto):
+        """Dibuja una entidad del mundo en su posición de pantalla con un solo blit"""
+        sprite, destino = self._ubicar_entidad(entidad, ancho, alto)
+        self.pantalla.blit(sprite, destino)
+        
     def mostrar_velocidad(self, velocidad):
-        texto = self.fuente_pequeña.render(f"Velocidad Juego: {velocidad:.1f}x", True, self.BLANCO)
-        self.pantalla.blit(texto, (10, 10))
+        texto = self.cache_textos.renderizar(self.fuente_pequeña, f"Velocidad Juego: {velocidad:.1f}x", self.BLANCO)
+        return self.pantalla.blit(texto, (10, 10))
         
     def mostrar_velocidad_carrito(self, velocidad_carrito):
-        texto = self.fuente_pequeña.render(f"Velocidad Carrito: {velocidad_carrito:.1f}px/s", True, self.BLANCO)
-        self.pantalla.blit(texto, (10, 30))
+        texto = self.cache_textos.renderizar(self.fuente_pequeña, f"Velocidad Carrito: {velocidad_carrito:.1f}px/s", self.BLANCO)
+        return self.pantalla.blit(texto, (10, 30))
         
     def mostrar_energia(self, carrito):
         barra_x, barra_y, barra_ancho, barra_alto = 10, 50, 200, 20
@@ -74,12 +170,17 @@ class GUI:
         if ancho_energia > 0:
             pygame.draw.rect(self.pantalla, color_energia, (barra_x, barra_y, ancho_energia, barra_alto))
         pygame.draw.rect(self.pantalla, self.BLANCO, (barra_x, barra_y, barra_ancho, barra_alto), 2)
-        texto_energia = self.fuente_pequeña.render(f"Energía: {carrito.energia_actual}/{carrito.energia_maxima}", True, self.BLANCO)
-        self.pantalla.blit(texto_energia, (barra_x + barra_ancho + 10, barra_y))
+        texto_energia = self.cache_textos.renderizar(self.fuente_pequeña, f"Energía: {carrito.energia_actual}/{carrito.energia_maxima}", self.BLANCO)
+        rect_texto = self.pantalla.blit(texto_energia, (barra_x + barra_ancho + 10, barra_y))
+        return rect_texto.union((barra_x, barra_y, barra_ancho, barra_alto))
+        
+    def mostrar_obstaculos_adelante(self, motor):
+        texto = self.cache_textos.renderizar(self.fuente_pequeña, f"Obstáculos adelante: {motor.contar_obstaculos_adelante()}", self.BLANCO)
+        return self.pantalla.blit(texto, (10, 75))
         
     def mostrar_controles_arbol(self, motor):
         ancho, alto = self.get_size()
-        x_base, y_base = 10, alto - 180
+        x_base, y_base = 10, alto - 220
         animacion_activa = motor.visualizador_avl.esta_animando()
         controles = [
             "T: Mostrar/Ocultar Árbol AVL",
@@ -89,10 +190,12 @@ class GUI:
             "Q: Iniciar animación recorrido" if not animacion_activa else "🎬 Animación en curso...",
             "E: Detener animación",
             "- : Lento  0: Normal  + : Rápido",
+            "Rueda: zoom  Arrastrar: mover  V: vista inicial",
             "ELIMINACIÓN:",
             "5: Modo eliminación" if not motor.visualizador_avl.modo_eliminacion else "🗑️ MODO ELIMINACIÓN ACTIVO",
             "ESC: Cancelar eliminación" if motor.visualizador_avl.modo_eliminacion else ""
         ]
+        rects = []
         for i, control in enumerate(controles):
             if control == "":
                 continue
@@ -102,41 +205,36 @@ class GUI:
                 color = self.NARANJA
             elif i == 4 and animacion_activa:
                 color = self.ROJO
-            elif i == 7:
+            elif i == 8:
                 color = self.ROJO
-            elif i == 8 and motor.visualizador_avl.modo_eliminacion:
+            elif i == 9 and motor.visualizador_avl.modo_eliminacion:
                 color = self.ROJO
-            elif i == 9:
+            elif i == 10:
                 color = self.ROJO
             else:
                 color = self.AZUL
-            texto = self.fuente_pequeña.render(control, True, color)
-            self.pantalla.blit(texto, (x_base, y_base + i * 20))
+            texto = self.cache_textos.renderizar(self.fuente_pequeña, control, color)
+            rects.append(self.pantalla.blit(texto, (x_base, y_base + i * 20)))
+        return rects[0].unionall(rects[1:])
     
     def mostrar_arbol_avl(self, motor):
         superficie_arbol = motor.obtener_superficie_arbol()
         if superficie_arbol:
             ancho, alto = self.get_size()
-            overlay = pygame.Surface((ancho, alto))
-            overlay.set_alpha(230)
-            overlay.fill((0, 0, 0))
-            self.pantalla.blit(overlay, (0, 0))
+            self.pantalla.blit(self._obtener_velo(ancho, alto, 230), (0, 0))
             arbol_rect = superficie_arbol.get_rect()
             arbol_rect.center = (ancho // 2, alto // 2)
             self.pantalla.blit(superficie_arbol, arbol_rect)
             instruccion = "Presiona T para ocultar el árbol AVL"
-            texto_instruccion = self.fuente_mediana.render(instruccion, True, self.BLANCO)
+            texto_instruccion = self.cache_textos.renderizar(self.fuente_mediana, instruccion, self.BLANCO)
             texto_rect = texto_instruccion.get_rect(center=(ancho // 2, alto - 30))
             self.pantalla.blit(texto_instruccion, texto_rect)
         
     def mostrar_game_over(self):
-        overlay = pygame.Surface((self.ancho_pantalla, self.alto_pantalla))
-        overlay.set_alpha(128)
-        overlay.fill(self.NEGRO)
-        self.pantalla.blit(overlay, (0, 0))
-        texto_game_over = self.fuente_grande.render("GAME OVER", True, self.ROJO)
+        self.pantalla.blit(self._obtener_velo(self.ancho_pantalla, self.alto_pantalla, 128), (0, 0))
+        texto_game_over = self.cache_textos.renderizar(self.fuente_grande, "GAME OVER", self.ROJO)
         rect_game_over = texto_game_over.get_rect(center=(self.ancho_pantalla//2, self.alto_pantalla//2 - 25))
         self.pantalla.blit(texto_game_over, rect_game_over)
-        texto_reiniciar = self.fuente_pequeña.render("Presiona R para reiniciar o ESC para salir", True, self.VERDE)
+        texto_reiniciar = self.cache_textos.renderizar(self.fuente_pequeña, "Presiona R para reiniciar o ESC para salir", self.VERDE)
         rect_reiniciar = texto_reiniciar.get_rect(center=(self.ancho_pantalla//2, self.alto_pantalla//2 + 25))
         self.pantalla.blit(texto_reiniciar, rect_reiniciar)
\ No newline at end of file
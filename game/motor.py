@@ -4,19 +4,53 @@ import os
 from .carrito import Carrito
 from .carretera import Carretera
 from .obstaculo import Obstaculo
+from .ventana_obstaculos import VentanaObstaculos
+from .rejilla_colisiones import RejillaColisiones
+from .colisiones_vectorizadas import ColisionesVectorizadas
 from .visualizador_avl import VisualizadorArbolAVL
 from estructuras.arbol_avl_obstaculos import ArbolAVLObstaculos
+from estructuras.arbol_avl_arreglos import ArbolAVLObstaculosArreglos
+
+# Implementaciones del árbol de obstáculos que se pueden elegir al crear el Motor
+ARBOLES_OBSTACULOS = {
+    'punteros': ArbolAVLObstaculos,
+    'arreglos': ArbolAVLObstaculosArreglos
+}
 
 class Motor:
-    def __init__(self):
+    # La simulación avanza en pasos fijos, independientes de los cuadros dibujados
+    PASOS_POR_SEGUNDO = 60
+    PASO_MS = 1000 / PASOS_POR_SEGUNDO
+    # Si un cuadro tarda más que esto, el resto se descarta para no encadenar atrasos
+    MAX_ATRASO_MS = 250
+
+    def __init__(self, tipo_arbol='punteros', podar_obstaculos=False, colisiones_vectorizadas=False,
+                 sin_ventana=False, nivel=None):
+        self.clase_arbol = ARBOLES_OBSTACULOS[tipo_arbol]
+        # Lista de {"x": distancia, "y": carril, "tipo": ...}; si es None se lee obstaculos.json
+        self.nivel = nivel
+        # Sin ventana no se crea el visualizador del árbol (que necesita fuentes)
+        # ni se imprimen los recorridos; solo corre la simulación
+        self.sin_ventana = sin_ventana
+        # Si está activo, los obstáculos que quedan atrás se eliminan y no vuelven en la siguiente vuelta
+        self.podar_obstaculos = podar_obstaculos
         self.ancho_pantalla = 800
         self.alto_pantalla = 600
         self.carretera = Carretera(self.ancho_pantalla, self.alto_pantalla)
         self.carrito = Carrito(self.ancho_pantalla // 2 - 25, self.alto_pantalla - 50)
-        self.obstaculos = []
+        self.colisiones_vectorizadas = None
+        if colisiones_vectorizadas:
+            try:
+                self.colisiones_vectorizadas = ColisionesVectorizadas()
+            except ImportError:
+                print("numpy no está instalado. Se usará la detección de colisiones por rejilla.")
+        # Con el núcleo vectorizado la rejilla no hace falta
+        self.rejilla_colisiones = RejillaColisiones() if self.colisiones_vectorizadas is None else None
+        self.ventana_obstaculos = VentanaObstaculos(self.rejilla_colisiones)
+        self.obstaculos = self.ventana_obstaculos.visibles
         self.obstaculos_predefinidos = []
-        self.arbol_obstaculos = ArbolAVLObstaculos()
-        self.visualizador_avl = VisualizadorArbolAVL()
+        self.arbol_obstaculos = self.clase_arbol()
+        self.visualizador_avl = None if sin_ventana else VisualizadorArbolAVL()
         self.mostrar_arbol = False
         self.tipo_recorrido_actual = 'inorden'
         self.juego_activo = True
@@ -25,6 +59,11 @@ class Motor:
         self.carril_actual = 1
         self.total_carriles = 3
         self.posiciones_carriles = []
+        self.acumulador_ms = 0.0
+        # Estadísticas de la partida
+        self.distancia_recorrida = 0.0
+        self.colisiones = 0
+        self.obstaculos_saltados = 0
         self.cargar_obstaculos_json()
         
     def manejar_eventos(self, evento):
@@ -39,60 +78,99 @@ class Motor:
                     self.actualizar_posicion_carril()
             elif evento.key == pygame.K_SPACE:
                 self.carrito.saltar()
-            elif evento.key == pygame.K_t:
-                self.mostrar_arbol = not self.mostrar_arbol
-            elif evento.key == pygame.K_1:
-                self.tipo_recorrido_actual = 'inorden'
-            elif evento.key == pygame.K_2:
-                self.tipo_recorrido_actual = 'preorden'
-            elif evento.key == pygame.K_3:
-                self.tipo_recorrido_actual = 'postorden'
-            elif evento.key == pygame.K_4:
-                self.tipo_recorrido_actual = 'anchura'
-            elif evento.key == pygame.K_5:
-                if self.mostrar_arbol:
-                    if self.visualizador_avl.modo_eliminacion:
-                        self.visualizador_avl.desactivar_modo_eliminacion()
-                    else:
-                        self.visualizador_avl.activar_modo_eliminacion()
-            elif evento.key == pygame.K_q:
-                if self.mostrar_arbol and not self.visualizador_avl.esta_animando():
-                    self.visualizador_avl.iniciar_animacion(self.arbol_obstaculos, self.tipo_recorrido_actual)
-            elif evento.key == pygame.K_e:
-                if self.visualizador_avl.esta_animando():
-                    self.visualizador_avl.detener_animacion()
-            elif evento.key == pygame.K_MINUS:
-                self.visualizador_avl.cambiar_velocidad_animacion('lenta')
-            elif evento.key == pygame.K_EQUALS:
-                self.visualizador_avl.cambiar_velocidad_animacion('rapida')
-            elif evento.key == pygame.K_0:
-                self.visualizador_avl.cambiar_velocidad_animacion('normal')
             elif evento.key == pygame.K_r and not self.juego_activo:
                 self.reiniciar_juego()
-            elif evento.key == pygame.K_ESCAPE:
-                if self.visualizador_avl.modo_eliminacion:
-                    self.visualizador_avl.desactivar_modo_eliminacion()
-                else:
-                    return False
-        elif evento.type == pygame.MOUSEBUTTONDOWN:
-            if evento.button == 1 and self.mostrar_arbol and self.visualizador_avl.modo_eliminacion:
-                if self.visualizador_avl.manejar_click_eliminacion(evento.pos, self.arbol_obstaculos):
-                    self.imprimir_recorridos()
+            elif self.visualizador_avl is not None:
+                return self._manejar_teclas_arbol(evento)
+        elif evento.type in (pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, pygame.MOUSEMOTION, pygame.MOUSEWHEEL):
+            # Soltar el botón termina el arrastre aunque la vista del árbol ya no se muestre
+            if self.visualizador_avl is not None and (self.mostrar_arbol or evento.type == pygame.MOUSEBUTTONUP):
+                self._manejar_mouse_arbol(evento)
         elif evento.type == pygame.VIDEORESIZE:
             self.ancho_pantalla = evento.w
             self.alto_pantalla = evento.h
             self.calcular_posiciones_carriles()
+
+    def _manejar_mouse_arbol(self, evento):
+        """Clic para eliminar, rueda para el zoom y arrastre para mover la vista del árbol"""
+        visualizador = self.visualizador_avl
+        if evento.type == pygame.MOUSEWHEEL:
+            visualizador.acercar(1.25 ** evento.y, self._posicion_en_arbol(pygame.mouse.get_pos()))
+        elif evento.type == pygame.MOUSEBUTTONDOWN:
+            # En modo eliminación el botón izquierdo elige nodos; el derecho siempre arrastra
+            if evento.button == 1 and visualizador.modo_eliminacion:
+                if visualizador.manejar_click_eliminacion(self._posicion_en_arbol(evento.pos), self.arbol_obstaculos):
+                    self.imprimir_recorridos()
+            elif evento.button in (1, 3):
+                visualizador.arrastrando = True
+        elif evento.type == pygame.MOUSEBUTTONUP:
+            if evento.button in (1, 3):
+                visualizador.arrastrando = False
+        elif visualizador.arrastrando:
+            visualizador.desplazar(*evento.rel)
+    
+    def _posicion_en_arbol(self, pos):
+        """Pasa una posición de la ventana a la superficie del árbol, que la GUI dibuja centrada"""
+        return (pos[0] - (self.ancho_pantalla // 2 - self.visualizador_avl.ancho // 2),
+                pos[1] - (self.alto_pantalla // 2 - self.visualizador_avl.alto // 2))
+
+    def _manejar_teclas_arbol(self, evento):
+        """Teclas de la vista del árbol AVL y sus animaciones"""
+        if evento.key == pygame.K_t:
+            self.mostrar_arbol = not self.mostrar_arbol
+            self.visualizador_avl.arrastrando = False
+        elif evento.key == pygame.K_1:
+            self.tipo_recorrido_actual = 'inorden'
+        elif evento.key == pygame.K_2:
+            self.tipo_recorrido_actual = 'preorden'
+        elif evento.key == pygame.K_3:
+            self.tipo_recorrido_actual = 'postorden'
+        elif evento.key == pygame.K_4:
+            self.tipo_recorrido_actual = 'anchura'
+        elif evento.key == pygame.K_5:
+            if self.mostrar_arbol:
+                if self.visualizador_avl.modo_eliminacion:
+                    self.visualizador_avl.desactivar_modo_eliminacion()
+                else:
+                    self.visualizador_avl.activar_modo_eliminacion()
+        elif evento.key == pygame.K_q:
+            if self.mostrar_arbol and not self.visualizador_avl.esta_animando():
+                self.visualizador_avl.iniciar_animacion(self.arbol_obstaculos, self.tipo_recorrido_actual)
+        elif evento.key == pygame.K_e:
+            if self.visualizador_avl.esta_animando():
+                self.visualizador_avl.detener_animacion()
+        elif evento.key == pygame.K_MINUS:
+            self.visualizador_avl.cambiar_velocidad_animacion('lenta')
+        elif evento.key == pygame.K_EQUALS:
+            self.visualizador_avl.cambiar_velocidad_animacion('rapida')
+        elif evento.key == pygame.K_0:
+            self.visualizador_avl.cambiar_velocidad_animacion('normal')
+        elif evento.key == pygame.K_v:
+            self.visualizador_avl.restablecer_vista()
+        elif evento.key == pygame.K_ESCAPE:
+            if self.visualizador_avl.modo_eliminacion:
+                self.visualizador_avl.desactivar_modo_eliminacion()
+            else:
+                return False
                     
     def cargar_obstaculos_json(self):
+        # Los obstáculos guardan y = base - distancia, así que la distancia (clave del
+        # AVL) permite convertir la ventana visible en un rango del árbol
+        self.base_obstaculos = self.alto_pantalla - 50
         try:
-            ruta_json = os.path.join(os.path.dirname(__file__), "..", "obstaculos.json")
-            with open(ruta_json, 'r', encoding='utf-8') as archivo:
-                datos_obstaculos = json.load(archivo)
-            self.obstaculos_predefinidos = []
-            self.arbol_obstaculos = ArbolAVLObstaculos()
-            for obs_data in datos_obstaculos:
-                self.crear_obstaculo_en_posicion(obs_data["x"], obs_data["y"], obs_data["tipo"])
-            self.imprimir_recorridos()
+            if self.nivel is not None:
+                datos_obstaculos = self.nivel
+            else:
+                ruta_json = os.path.join(os.path.dirname(__file__), "..", "obstaculos.json")
+                with open(ruta_json, 'r', encoding='utf-8') as archivo:
+                    datos_obstaculos = json.load(archivo)
+            self.arbol_obstaculos = self.clase_arbol()
+            obstaculos = [self._crear_obstaculo(obs_data["x"], obs_data["y"], obs_data["tipo"])
+                          for obs_data in datos_obstaculos]
+            self.obstaculos_predefinidos = self.arbol_obstaculos.construir_desde(obstaculos)
+            print(f"Obstáculos cargados en AVL: {len(self.obstaculos_predefinidos)} de {len(obstaculos)}")
+            if not self.sin_ventana:
+                self.imprimir_recorridos()
         except FileNotFoundError:
             print("Archivo obstaculos.json no encontrado. No se cargarán obstáculos.")
         except json.JSONDecodeError:
@@ -100,13 +178,17 @@ class Motor:
         except Exception as e:
             print(f"Error al cargar obstáculos: {e}")
 
-    def crear_obstaculo_en_posicion(self, distancia, carril, tipo):
+    def _crear_obstaculo(self, distancia, carril, tipo):
         ancho_carril = self.ancho_pantalla // self.total_carriles
         pos_x = (carril * ancho_carril) + (ancho_carril // 2) - 20
-        pos_y = (self.alto_pantalla - 50) - distancia
+        pos_y = self.base_obstaculos - distancia
         obstaculo = Obstaculo(pos_x, pos_y, tipo)
         obstaculo.x_original = distancia
         obstaculo.y_original = carril
+        return obstaculo
+
+    def crear_obstaculo_en_posicion(self, distancia, carril, tipo):
+        obstaculo = self._crear_obstaculo(distancia, carril, tipo)
         self.obstaculos_predefinidos.append(obstaculo)
         if self.arbol_obstaculos.insertar_obstaculo(obstaculo):
             print(f"Obstáculo insertado en AVL: ({distancia}, {carril}) - {tipo}")
@@ -114,38 +196,65 @@ class Motor:
             print(f"Error: Obstáculo duplicado en ({distancia}, {carril})")
             self.obstaculos_predefinidos.remove(obstaculo)
         
+    def avanzar(self, milisegundos):
+        """Acumula tiempo real y corre los pasos fijos que correspondan; retorna cuántos corrió.
+
+        Si el equipo va lento se corren varios pasos en un cuadro, de modo que el
+        juego no se vuelve más lento: solo se dibujan menos cuadros. Lo que sobra
+        del acumulador indica cuánto interpolar el dibujo del carrito.
+        """
+        self.acumulador_ms += min(milisegundos, self.MAX_ATRASO_MS)
+        pasos = 0
+        while self.acumulador_ms >= self.PASO_MS:
+            self.acumulador_ms -= self.PASO_MS
+            self.actualizar()
+            pasos += 1
+        self.carrito.alfa_dibujo = self.acumulador_ms / self.PASO_MS if self.juego_activo else 1.0
+        return pasos
+        
     def actualizar(self):
+        """Avanza la simulación un paso fijo de PASO_MS"""
         if not self.juego_activo:
             return
         if not self.posiciones_carriles:
             self.calcular_posiciones_carriles()
             self.actualizar_posicion_carril()
-        self.carrito.actualizar_salto()
+        self.carrito.actualizar_salto(self.PASO_MS)
+        self.carretera.actualizar(self.velocidad_juego)
+        self.carrito.y_anterior = self.carrito.y
         self.carrito.y -= self.velocidad_carrito_x
+        self.distancia_recorrida += self.velocidad_carrito_x
         if self.carrito.y < -self.carrito.alto:
             self.carrito.y = self.alto_pantalla
+            self.carrito.y_anterior = self.carrito.y
         self.actualizar_obstaculos_visibles()
-        for obstaculo in self.obstaculos:
-            if self.verificar_colision(self.carrito, obstaculo):
-                if not self.carrito.esta_saltando():
-                    danio = obstaculo.obtener_danio_energia()
-                    sin_energia = self.carrito.reducir_energia(danio)
-                    if sin_energia:
-                        self.juego_activo = False
-                obstaculo.desactivar()
+        if self.colisiones_vectorizadas is not None:
+            colisiones = self.colisiones_vectorizadas.detectar(self.arbol_obstaculos,
+                                                               self.carrito.obtener_rect_colision())
+        else:
+            # Fase amplia: solo los visibles en las celdas que rodean al carrito
+            candidatos = self.rejilla_colisiones.consultar(self.carrito.obtener_rect_colision(),
+                                                           Obstaculo.ancho - 4, Obstaculo.alto - 4)
+            colisiones = [obstaculo for obstaculo in candidatos
+                          if self.verificar_colision(self.carrito, obstaculo)]
+        for obstaculo in colisiones:
+            if self.carrito.esta_saltando():
+                self.obstaculos_saltados += 1
+            else:
+                self.colisiones += 1
+                danio = obstaculo.obtener_danio_energia()
+                sin_energia = self.carrito.reducir_energia(danio)
+                if sin_energia:
+                    self.juego_activo = False
+            obstaculo.desactivar()
+            self.ventana_obstaculos.descartar(obstaculo)
         self.velocidad_juego += 0.001
         self.velocidad_carrito_x += 0.001
         
     def verificar_colision(self, carrito, obstaculo):
         if not obstaculo.activo:
             return False
-        rect_carrito = carrito.obtener_rect()
-        rect_obstaculo = obstaculo.obtener_rect()
-        rect_carrito_reducido = pygame.Rect(rect_carrito.x + 2, rect_carrito.y + 2, 
-                                          rect_carrito.width - 4, rect_carrito.height - 4)
-        rect_obstaculo_reducido = pygame.Rect(rect_obstaculo.x + 2, rect_obstaculo.y + 2, 
-                                            rect_obstaculo.width - 4, rect_obstaculo.height - 4)
-        return rect_carrito_reducido.colliderect(rect_obstaculo_reducido)
+        return carrito.obtener_rect_colision().colliderect(obstaculo.obtener_rect_colision())
     
     def calcular_posiciones_carriles(self):
         ancho_carril = self.ancho_pantalla // self.total_carriles
@@ -161,28 +270,73 @@ class Motor:
             for obstaculo in self.obstaculos_predefinidos:
                 carril_actual = min(2, max(0, int(obstaculo.x // ancho_carril)))
                 obstaculo.x = (carril_actual * ancho_carril) + (ancho_carril // 2) - 20
+                obstaculo.rect_colision = None
+            # La rejilla y el núcleo vectorizado guardan posiciones de pantalla: se reconstruyen
+            self.ventana_obstaculos.reiniciar()
+            if self.colisiones_vectorizadas is not None:
+                self.colisiones_vectorizadas.invalidar()
     
     def actualizar_posicion_carril(self):
         if self.posiciones_carriles:
             self.carrito.x = self.posiciones_carriles[self.carril_actual]
             
     def actualizar_obstaculos_visibles(self):
-        self.obstaculos = []
         margen = 200
         limite_superior = self.carrito.y + margen
         limite_inferior = self.carrito.y - self.alto_pantalla - margen
-        for obstaculo in self.obstaculos_predefinidos:
-            if obstaculo.activo and limite_inferior <= obstaculo.y <= limite_superior:
-                self.obstaculos.append(obstaculo)
+        distancia_min = self.base_obstaculos - limite_superior
+        distancia_max = self.base_obstaculos - limite_inferior
+        if self.podar_obstaculos:
+            self.podar_obstaculos_pasados(distancia_min - margen)
+        self.obstaculos = self.ventana_obstaculos.actualizar(self.arbol_obstaculos,
+                                                             distancia_min, distancia_max)
+        
+    def distancia_carrito(self):
+        """Distancia del carrito en la misma escala que la clave del árbol de obstáculos"""
+        return self.base_obstaculos - self.carrito.y
+    
+    def contar_obstaculos_adelante(self):
+        """Cantidad de obstáculos por delante del carrito, en O(log n)"""
+        detras = self.arbol_obstaculos.rank(self.distancia_carrito(), float('inf'))
+        return self.arbol_obstaculos.obtener_tamaño() - detras
+    
+    def obstaculo_adelante(self, k=0):
+        """Retorna el k-ésimo obstáculo por delante del carrito (desde 0), o None"""
+        posicion = self.arbol_obstaculos.rank(self.distancia_carrito(), float('inf')) + k
+        if posicion >= self.arbol_obstaculos.obtener_tamaño():
+            return None
+        return self.arbol_obstaculos.select(posicion).obstaculo
+        
+    def podar_obstaculos_pasados(self, distancia_limite):
+        """Elimina los obstáculos con distancia <= distancia_limite; retorna cuántos quitó del árbol"""
+        version_previa = self.arbol_obstaculos.version
+        eliminados = self.arbol_obstaculos.eliminar_rango(float('-inf'), distancia_limite)
+        if eliminados:
+            if self.colisiones_vectorizadas is not None:
+                self.colisiones_vectorizadas.podar(self.arbol_obstaculos, version_previa, distancia_limite)
+            # obstaculos_predefinidos está ordenado por distancia: basta recortar el prefijo
+            fin = 0
+            while (fin < len(self.obstaculos_predefinidos)
+                   and self.obstaculos_predefinidos[fin].x_original <= distancia_limite):
+                fin += 1
+            del self.obstaculos_predefinidos[:fin]
+        return eliminados
         
     def reiniciar_juego(self):
-        self.obstaculos.clear()
-        self.arbol_obstaculos = ArbolAVLObstaculos()
+        self.ventana_obstaculos.reiniciar()
+        self.arbol_obstaculos = self.clase_arbol()
         self.juego_activo = True
         self.velocidad_juego = 1.0
         self.velocidad_carrito_x = 2.0
+        self.carretera.linea_posicion = 0
         self.carrito.x = self.ancho_pantalla // 2 - 25
         self.carrito.y = self.alto_pantalla - 50
+        self.carrito.y_anterior = self.carrito.y
+        self.carrito.alfa_dibujo = 1.0
+        self.acumulador_ms = 0.0
+        self.distancia_recorrida = 0.0
+        self.colisiones = 0
+        self.obstaculos_saltados = 0
         self.carrito.energia_actual = self.carrito.energia_maxima
         self.carrito.saltando = False
         self.carrito.tiempo_salto = 0
@@ -191,7 +345,7 @@ class Motor:
             obstaculo.activo = True
     
     def obtener_superficie_arbol(self):
-        if self.mostrar_arbol and not self.arbol_obstaculos.esta_vacio():
+        if self.mostrar_arbol and self.visualizador_avl is not None and not self.arbol_obstaculos.esta_vacio():
             return self.visualizador_avl.dibujar_arbol(self.arbol_obstaculos, 
                                                      mostrar_recorrido=True, 
                                                      tipo_recorrido=self.tipo_recorrido_actual)
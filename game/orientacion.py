@@ -0,0 +1,10 @@
+"""Conversión entre el mundo del juego y la pantalla.
+
+El mundo es una carretera vertical: su ancho es el alto de la ventana y su
+largo es el ancho de la ventana. En pantalla se ve girado 90° en sentido
+horario, de modo que el punto (x, y) del mundo cae en (ancho - 1 - y, x).
+"""
+
+def rect_a_pantalla(x, y, w, h, ancho_pantalla):
+    """Convierte un rectángulo del mundo en el rectángulo que ocupa en pantalla"""
+    return (ancho_pantalla - y - h, x, h, w)
@@ -0,0 +1,44 @@
+class RejillaColisiones:
+    """Fase amplia de colisiones: obstáculos agrupados por columna y tramo de pantalla.
+
+    Cada obstáculo se registra en la celda de la esquina superior izquierda de
+    su rectángulo de colisión. Como todos los obstáculos tienen el mismo tamaño,
+    la consulta extiende el área buscada hacia arriba y a la izquierda en ese
+    tamaño, y así no se pierde ningún obstáculo que pueda tocar al carrito.
+    """
+    def __init__(self, ancho_celda=100, alto_celda=100):
+        self.ancho_celda = ancho_celda
+        self.alto_celda = alto_celda
+        self.celdas = {}
+        self.celda_de = {}
+
+    def limpiar(self):
+        self.celdas.clear()
+        self.celda_de.clear()
+
+    def agregar(self, obstaculo):
+        rect = obstaculo.obtener_rect_colision()
+        celda = (rect.x // self.ancho_celda, rect.y // self.alto_celda)
+        self.celdas.setdefault(celda, []).append(obstaculo)
+        self.celda_de[obstaculo] = celda
+
+    def quitar(self, obstaculo):
+        celda = self.celda_de.pop(obstaculo, None)
+        if celda is None:
+            return
+        ocupantes = self.celdas[celda]
+        ocupantes.remove(obstaculo)
+        if not ocupantes:
+            del self.celdas[celda]
+
+    def consultar(self, rect, ancho_obstaculo, alto_obstaculo):
+        """Genera los obstáculos cuyas celdas pueden intersectar rect"""
+        col_inicio = (rect.x - ancho_obstaculo) // self.ancho_celda
+        col_fin = (rect.right - 1) // self.ancho_celda
+        fila_inicio = (rect.y - alto_obstaculo) // self.alto_celda
+        fila_fin = (rect.bottom - 1) // self.alto_celda
+        for col in range(col_inicio, col_fin + 1):
+            for fila in range(fila_inicio, fila_fin + 1):
+                ocupantes = self.celdas.get((col, fila))
+                if ocupantes:
+                    yield from ocupantes
@@ -0,0 +1,46 @@
+from bisect import bisect_left
+
+class RejillaNodos:
+    """Índice de las posiciones de los nodos para saber cuál está bajo un clic.
+
+    Las posiciones se reparten en filas de alto_fila píxeles, y dentro de cada
+    fila quedan ordenadas por x. Con alto_fila igual al espacio entre niveles,
+    cada nivel del árbol cae en su propia fila. Una consulta mira solo las
+    filas que toca el radio, y en cada una busca por bisección la x del clic y
+    avanza hacia los lados mientras la distancia pueda mejorar.
+    """
+    def __init__(self, posiciones, alto_fila):
+        self.alto_fila = alto_fila
+        filas = {}
+        for nodo, (x, y) in posiciones.items():
+            filas.setdefault(y // alto_fila, []).append((x, y, nodo))
+        # fila -> (xs ordenadas, ys, nodos) en el mismo orden
+        self.filas = {}
+        for fila, ocupantes in filas.items():
+            ocupantes.sort(key=lambda ocupante: ocupante[0])
+            self.filas[fila] = ([x for x, _, _ in ocupantes], [y for _, y, _ in ocupantes],
+                                [nodo for _, _, nodo in ocupantes])
+
+    def mas_cercano(self, x, y, radio, admitidos=None):
+        """Nodo más cercano a (x, y) a distancia <= radio, o None; si hay admitidos, solo entre ellos"""
+        mejor = None
+        mejor_distancia = radio * radio
+        for fila in range(int((y - radio) // self.alto_fila), int((y + radio) // self.alto_fila) + 1):
+            ocupantes = self.filas.get(fila)
+            if ocupantes is None:
+                continue
+            xs, ys, nodos = ocupantes
+            inicio = bisect_left(xs, x)
+            # Hacia cada lado la distancia en x solo crece: se corta al pasar la mejor
+            for indices in (range(inicio - 1, -1, -1), range(inicio, len(xs))):
+                for i in indices:
+                    dx = xs[i] - x
+                    if dx * dx > mejor_distancia:
+                        break
+                    dy = ys[i] - y
+                    distancia = dx * dx + dy * dy
+                    if distancia <= mejor_distancia and (admitidos is None or nodos[i] in admitidos):
+                        if distancia < mejor_distancia or mejor is None:
+                            mejor = nodos[i]
+                            mejor_distancia = distancia
+        return mejor
@@ -0,0 +1,42 @@
+import pygame
+from .motor import Motor
+
+class SimulacionSinVentana:
+    """Corre el Motor sin ventana ni fuentes, tan rápido como permita la CPU.
+
+    El reloj se inyecta: ``reloj`` es una función sin argumentos que retorna los
+    milisegundos de cada cuadro; por omisión cada cuadro dura exactamente un paso
+    fijo del motor. Las entradas son guionadas: ``entradas`` es un dict
+    {cuadro: [teclas]} o una función (motor, cuadro) que retorna las teclas que
+    se pulsan en ese cuadro. Las teclas llegan al motor como eventos KEYDOWN,
+    igual que en el juego.
+    """
+    def __init__(self, entradas=None, reloj=None, **opciones_motor):
+        self.motor = Motor(sin_ventana=True, **opciones_motor)
+        self.entradas = entradas
+        self.reloj = reloj
+        self.cuadro = 0
+
+    def _teclas(self):
+        if self.entradas is None:
+            return ()
+        if callable(self.entradas):
+            return self.entradas(self.motor, self.cuadro) or ()
+        return self.entradas.get(self.cuadro, ())
+
+    def paso(self):
+        """Corre un cuadro: pulsa las teclas guionadas y avanza el reloj; retorna los pasos simulados"""
+        for tecla in self._teclas():
+            self.motor.manejar_eventos(pygame.event.Event(pygame.KEYDOWN, key=tecla))
+        milisegundos = self.reloj() if self.reloj is not None else Motor.PASO_MS
+        self.cuadro += 1
+        return self.motor.avanzar(milisegundos)
+
+    def correr(self, cuadros):
+        """Corre hasta ``cuadros`` cuadros o hasta que termine el juego; retorna los pasos simulados"""
+        pasos = 0
+        for _ in range(cuadros):
+            if not self.motor.juego_activo:
+                break
+            pasos += self.paso()
+        return pasos
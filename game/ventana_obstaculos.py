@@ -0,0 +1,69 @@
+from collections import deque
+
+class VentanaObstaculos:
+    """Conjunto de obstáculos visibles que se desliza sobre el árbol AVL.
+
+    Mientras la ventana de distancias solo avanza, cada cuadro agrega los
+    obstáculos que entran por el borde frontal y descarta los que salen por el
+    borde trasero. Si la ventana retrocede (el carrito da la vuelta), se encoge
+    o el árbol cambia, se reposiciona con una consulta de rango.
+
+    Si recibe una rejilla de colisiones, la mantiene sincronizada con los
+    obstáculos visibles.
+    """
+    def __init__(self, rejilla=None):
+        self.visibles = deque()
+        self.rejilla = rejilla
+        self.reiniciar()
+
+    def reiniciar(self):
+        """Vacía la ventana; el próximo cuadro la reposiciona desde el árbol"""
+        self.visibles.clear()
+        if self.rejilla is not None:
+            self.rejilla.limpiar()
+        self.arbol = None
+        self.version_arbol = None
+        self.distancia_min = None
+        self.distancia_max = None
+        self.cursor = None
+        self.siguiente = None
+
+    def actualizar(self, arbol, distancia_min, distancia_max):
+        """Desliza la ventana a [distancia_min, distancia_max] y retorna los visibles"""
+        if (arbol is not self.arbol or arbol.version != self.version_arbol
+                or distancia_min < self.distancia_min or distancia_max < self.distancia_max):
+            self._reposicionar(arbol, distancia_min)
+
+        # Borde trasero: los visibles están ordenados por distancia
+        while self.visibles and self.visibles[0].x_original < distancia_min:
+            obstaculo = self.visibles.popleft()
+            if self.rejilla is not None:
+                self.rejilla.quitar(obstaculo)
+
+        # Borde frontal: el cursor entrega los nodos en orden, uno a la vez
+        while self.siguiente is not None and self.siguiente.x <= distancia_max:
+            nodo = self.siguiente
+            self.siguiente = next(self.cursor, None)
+            if nodo.x >= distancia_min and nodo.obstaculo.activo:
+                self.visibles.append(nodo.obstaculo)
+                if self.rejilla is not None:
+                    self.rejilla.agregar(nodo.obstaculo)
+
+        self.distancia_min = distancia_min
+        self.distancia_max = distancia_max
+        return self.visibles
+
+    def _reposicionar(self, arbol, distancia_min):
+        self.visibles.clear()
+        if self.rejilla is not None:
+            self.rejilla.limpiar()
+        self.arbol = arbol
+        self.version_arbol = arbol.version
+        self.cursor = arbol.rango(distancia_min, float('inf'))
+        self.siguiente = next(self.cursor, None)
+
+    def descartar(self, obstaculo):
+        """Quita de la ventana un obstáculo que dejó de estar activo"""
+        self.visibles.remove(obstaculo)
+        if self.rejilla is not None:
+            self.rejilla.quitar(obstaculo)
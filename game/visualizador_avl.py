@@ -1,7 +1,19 @@
 import pygame
 import math
+from game.cache_textos import CacheTextos
+from game.disposicion_arbol import DisposicionArbol
+from game.rejilla_nodos import RejillaNodos
 
 class VisualizadorArbolAVL:
+    # Límites del zoom de la cámara
+    ZOOM_MIN = 0.0001
+    ZOOM_MAX = 4.0
+    # Por debajo de este zoom los nodos se dibujan sin textos
+    ZOOM_ETIQUETAS = 0.7
+    # Por debajo de este zoom, un subárbol más angosto que ANCHO_RESUMEN píxeles se dibuja como un solo glifo
+    ZOOM_RESUMEN = 0.35
+    ANCHO_RESUMEN = 48
+
     def __init__(self, ancho=1000, alto=700):
         self.ancho = ancho
         self.alto = alto
@@ -12,8 +24,24 @@ class VisualizadorArbolAVL:
         self.tipo_recorrido_animacion = 'inorden'
         self.tiempo_ultimo_paso = 0
         self.intervalo_animacion = 1000
-        self.nodos_visitados = []
+        self.nodos_visitados = set()
         self.nodo_actual = None
+        # Orden de recorrido para numerar los nodos: (árbol, versión, tipo, {nodo: posición})
+        self.orden_guardado = None
+        # Posiciones de los nodos: (árbol, versión, {nodo: (x, y)})
+        self.posiciones_guardadas = None
+        # Índice para los clics, armado sobre esas posiciones: (posiciones, rejilla)
+        self.rejilla_guardada = None
+        # Capa con fondo, conexiones y nodos ya dibujados, y la clave con la que se dibujó
+        self.capa_arbol = None
+        self.clave_capa = None
+        # Cámara: pantalla = posición * zoom + vista
+        self.zoom = 1.0
+        self.vista_x = 0.0
+        self.vista_y = 0.0
+        self.arrastrando = False
+        # Nodos dibujados uno por uno en la capa, con su posición en pantalla
+        self.nodos_en_vista = {}
         self.modo_eliminacion = False
         self.mensaje_eliminacion = ""
         self.tiempo_mensaje = 0
@@ -30,12 +58,22 @@ class VisualizadorArbolAVL:
         self.colores_obstaculos = {'roca': (139, 69, 19), 'cono': (255, 165, 0), 'hueco': (64, 64, 64), 'aceite': (75, 0, 130)}
         self.radio_nodo = 30
         self.espacio_vertical = 80
-        self.espacio_horizontal_min = 60
+        # Separación entre nodos vecinos: el mínimo evita que se toquen, el máximo que un árbol chico se desparrame
+        self.espacio_horizontal_min = 2 * self.radio_nodo + 10
+        self.espacio_horizontal_max = 240
+        # Píxeles por unidad de la disposición, sin zoom
+        self.unidad = self.espacio_horizontal_max
+        self.disposicion = DisposicionArbol()
+        # Radio de los nodos y si llevan textos, según el zoom de la última capa
+        self.radio_en_vista = self.radio_nodo
+        self.etiquetas_en_vista = True
         
         pygame.font.init()
         self.fuente_grande = pygame.font.Font(None, 24)
         self.fuente_pequeña = pygame.font.Font(None, 16)
         self.fuente_titulo = pygame.font.Font(None, 32)
+        # Las etiquetas de los nodos se repiten cuadro a cuadro
+        self.cache_textos = CacheTextos(2048)
     
     def crear_superficie(self):
         """Crea la superficie para dibujar"""
@@ -51,20 +89,30 @@ class VisualizadorArbolAVL:
         if self.animacion_activa:
             self.actualizar_animacion()
         
-        self.superficie.fill(self.BLANCO)
-        
         if arbol.esta_vacio():
+            self.superficie.fill(self.BLANCO)
             self._dibujar_mensaje("Árbol vacío", self.ancho // 2, self.alto // 2)
             return self.superficie
         
-        # Calcular posiciones de todos los nodos
-        posiciones = self._calcular_posiciones(arbol.raiz)
-        
-        # Dibujar conexiones primero
-        self._dibujar_conexiones(arbol.raiz, posiciones)
-        
-        # Dibujar nodos
-        self._dibujar_nodos(arbol.raiz, posiciones, mostrar_recorrido, tipo_recorrido)
+        # Fondo, conexiones y nodos salen de una capa que solo se redibuja si el árbol
+        # o el modo de dibujo cambió; un cuadro sin cambios la copia y agrega lo dinámico
+        posiciones = self._obtener_posiciones(arbol)
+        orden_recorrido = self._obtener_orden_recorrido(arbol, tipo_recorrido) if mostrar_recorrido else {}
+        clave = (arbol, arbol.version, tipo_recorrido if mostrar_recorrido else None, self.animacion_activa,
+                 self.zoom, self.vista_x, self.vista_y)
+        if clave != self.clave_capa:
+            self._dibujar_capa_arbol(arbol, posiciones, orden_recorrido)
+            self.clave_capa = clave
+        self.superficie.blit(self.capa_arbol, (0, 0))
+        
+        # Resaltados de la animación encima de la capa, solo de los nodos que se ven
+        if self.animacion_activa:
+            en_vista = self.nodos_en_vista
+            for nodo in en_vista:
+                if nodo in self.nodos_visitados:
+                    self._dibujar_nodo_individual(self.superficie, nodo, en_vista, orden_recorrido, True)
+            if self.nodo_actual is not None:
+                self._dibujar_nodo_individual(self.superficie, self.nodo_actual, en_vista, orden_recorrido, True)
         
         # Dibujar información del árbol
         self._dibujar_info_arbol(arbol)
@@ -82,100 +130,99 @@ class VisualizadorArbolAVL:
         
         return self.superficie
     
+    def _dibujar_capa_arbol(self, arbol, posiciones, orden_recorrido):
+        """Dibuja en la capa el fondo, las conexiones y los nodos sin resaltar que caen en la vista"""
+        if self.capa_arbol is None:
+            self.capa_arbol = pygame.Surface((self.ancho, self.alto))
+        self.capa_arbol.fill(self.BLANCO)
+        
+        zoom = self.zoom
+        self.radio_en_vista = max(2, round(self.radio_nodo * zoom))
+        self.etiquetas_en_vista = zoom >= self.ZOOM_ETIQUETAS
+        # La vista en coordenadas del árbol, ampliada para no cortar los textos de los nodos del borde
+        margen = self.radio_nodo + 30 / zoom
+        vista = (-self.vista_x / zoom - margen, -self.vista_y / zoom - margen,
+                 (self.ancho - self.vista_x) / zoom + margen, (self.alto - self.vista_y) / zoom + margen)
+        ancho_resumen = self.ANCHO_RESUMEN / zoom if zoom < self.ZOOM_RESUMEN else 0
+        
+        en_vista = {}
+        conexiones = []
+        resumenes = []
+        for nodo, izquierdo, derecho, resumen in self.disposicion.en_vista(
+                arbol.raiz, posiciones, self.unidad, self.espacio_vertical, vista, ancho_resumen):
+            x, y = self._a_pantalla(posiciones[nodo])
+            if resumen is not None:
+                x_min, x_max, y_max = resumen
+                resumenes.append((nodo, x, y, self._a_pantalla((x_min, y_max)), self._a_pantalla((x_max, y_max))))
+                continue
+            en_vista[nodo] = (x, y)
+            for hijo in (izquierdo, derecho):
+                if hijo is not None:
+                    conexiones.append(((x, y), self._a_pantalla(posiciones[hijo])))
+        self.nodos_en_vista = en_vista
+        
+        for inicio, fin in conexiones:
+            pygame.draw.line(self.capa_arbol, self.GRIS, inicio, fin, 2)
+        for nodo, x, y, esquina_izquierda, esquina_derecha in resumenes:
+            self._dibujar_resumen(self.capa_arbol, nodo, (x, y), esquina_izquierda, esquina_derecha)
+        for nodo in en_vista:
+            self._dibujar_nodo_individual(self.capa_arbol, nodo, en_vista, orden_recorrido)
+    
+    def _a_pantalla(self, posicion):
+        """Aplica la cámara a una posición del árbol"""
+        return (round(posicion[0] * self.zoom + self.vista_x), round(posicion[1] * self.zoom + self.vista_y))
+    
+    def _dibujar_resumen(self, superficie, nodo, punta, esquina_izquierda, esquina_derecha):
+        """Dibuja un subárbol colapsado como un triángulo con su cantidad de nodos"""
+        # Que no quede más angosto que un nodo
+        mitad = max(self.radio_en_vista, (esquina_derecha[0] - esquina_izquierda[0]) // 2)
+        centro = (esquina_izquierda[0] + esquina_derecha[0]) // 2
+        base = esquina_izquierda[1]
+        puntos = (punta, (centro - mitad, base), (centro + mitad, base))
+        pygame.draw.polygon(superficie, (210, 210, 210), puntos)
+        pygame.draw.polygon(superficie, self.GRIS, puntos, 1)
+        if mitad >= 15 and base - punta[1] >= 24:
+            superficie_tamaño = self.cache_textos.renderizar(self.fuente_pequeña, str(nodo.tamaño), self.NEGRO)
+            superficie.blit(superficie_tamaño, superficie_tamaño.get_rect(center=(centro, (punta[1] + 2 * base) // 3)))
+    
+    def _obtener_posiciones(self, arbol):
+        """Posiciones de los nodos; se recalculan solo si el árbol cambió"""
+        guardadas = self.posiciones_guardadas
+        if guardadas is None or guardadas[0] is not arbol or guardadas[1] != arbol.version:
+            guardadas = self.posiciones_guardadas = (arbol, arbol.version, self._calcular_posiciones(arbol.raiz))
+        return guardadas[2]
+    
     def _calcular_posiciones(self, raiz):
         """Calcula las posiciones (x, y) de todos los nodos"""
         if raiz is None:
             return {}
         
-        posiciones = {}
+        x_min, x_max = self.disposicion.acomodar(raiz)
         
-        # Calcular el ancho necesario para el árbol
-        ancho_arbol = self._calcular_ancho_arbol(raiz)
+        # La unidad más grande con la que el árbol cabe a lo ancho, sin bajar del mínimo
+        ancho_disponible = self.ancho - 2 * (self.radio_nodo + 10)
+        unidad = self.espacio_horizontal_max
+        if x_max > x_min:
+            unidad = max(self.espacio_horizontal_min, min(unidad, ancho_disponible / (x_max - x_min)))
         
-        # Posición inicial de la raíz
-        x_raiz = self.ancho // 2
+        # Centrar el árbol en la superficie
+        x_raiz = self.ancho / 2 - (x_min + x_max) / 2 * unidad
         y_raiz = 60
+        self.unidad = unidad
         
-        self._calcular_posiciones_recursivo(raiz, posiciones, x_raiz, y_raiz, ancho_arbol // 2)
-        
-        return posiciones
-    
-    def _calcular_ancho_arbol(self, nodo):
-        """Calcula el ancho necesario para dibujar el árbol"""
-        if nodo is None:
-            return 0
-        
-        # Contar nodos en el nivel más ancho
-        niveles = {}
-        self._contar_nodos_por_nivel(nodo, 0, niveles)
-        
-        max_nodos = max(niveles.values()) if niveles else 1
-        return max_nodos * self.espacio_horizontal_min * 2
-    
-    def _contar_nodos_por_nivel(self, nodo, nivel, niveles):
-        """Cuenta los nodos en cada nivel"""
-        if nodo is not None:
-            niveles[nivel] = niveles.get(nivel, 0) + 1
-            self._contar_nodos_por_nivel(nodo.izquierdo, nivel + 1, niveles)
-            self._contar_nodos_por_nivel(nodo.derecho, nivel + 1, niveles)
-    
-    def _calcular_posiciones_recursivo(self, nodo, posiciones, x, y, separacion):
-        """Calcula posiciones recursivamente"""
-        if nodo is None:
-            return
-        
-        posiciones[nodo] = (x, y)
-        
-        # Reducir separación para niveles más profundos
-        nueva_separacion = max(separacion // 2, self.espacio_horizontal_min)
-        
-        if nodo.izquierdo:
-            self._calcular_posiciones_recursivo(
-                nodo.izquierdo, posiciones, 
-                x - separacion, y + self.espacio_vertical, nueva_separacion
-            )
-        
-        if nodo.derecho:
-            self._calcular_posiciones_recursivo(
-                nodo.derecho, posiciones, 
-                x + separacion, y + self.espacio_vertical, nueva_separacion
-            )
-    
-    def _dibujar_conexiones(self, nodo, posiciones):
-        """Dibuja las líneas que conectan los nodos"""
-        if nodo is None or nodo not in posiciones:
-            return
-        
-        x, y = posiciones[nodo]
-        
-        if nodo.izquierdo and nodo.izquierdo in posiciones:
-            x_izq, y_izq = posiciones[nodo.izquierdo]
-            pygame.draw.line(self.superficie, self.GRIS, (x, y), (x_izq, y_izq), 2)
-            self._dibujar_conexiones(nodo.izquierdo, posiciones)
-        
-        if nodo.derecho and nodo.derecho in posiciones:
-            x_der, y_der = posiciones[nodo.derecho]
-            pygame.draw.line(self.superficie, self.GRIS, (x, y), (x_der, y_der), 2)
-            self._dibujar_conexiones(nodo.derecho, posiciones)
+        return self.disposicion.ubicar(raiz, x_raiz, y_raiz, unidad, self.espacio_vertical)
     
-    def _dibujar_nodos(self, nodo, posiciones, mostrar_recorrido, tipo_recorrido):
-        """Dibuja todos los nodos del árbol"""
-        if nodo is None:
-            return
-        
-        # Obtener orden del recorrido para numeración
-        orden_recorrido = {}
-        if mostrar_recorrido:
-            recorrido = getattr(self, f'_obtener_recorrido_{tipo_recorrido}')(nodo)
-            for i, n in enumerate(recorrido):
-                orden_recorrido[n] = i + 1
-        
-        self._dibujar_nodo_individual(nodo, posiciones, orden_recorrido)
-        self._dibujar_nodos(nodo.izquierdo, posiciones, mostrar_recorrido, tipo_recorrido)
-        self._dibujar_nodos(nodo.derecho, posiciones, mostrar_recorrido, tipo_recorrido)
+    def _obtener_orden_recorrido(self, arbol, tipo_recorrido):
+        """Posición (desde 1) de cada nodo en el recorrido; se recalcula solo si el árbol cambió"""
+        guardado = self.orden_guardado
+        if (guardado is None or guardado[0] is not arbol or guardado[1] != arbol.version
+                or guardado[2] != tipo_recorrido):
+            orden = {nodo: i + 1 for i, nodo in enumerate(arbol.obtener_recorrido(tipo_recorrido))}
+            self.orden_guardado = guardado = (arbol, arbol.version, tipo_recorrido, orden)
+        return guardado[3]
     
-    def _dibujar_nodo_individual(self, nodo, posiciones, orden_recorrido):
-        """Dibuja un nodo individual"""
+    def _dibujar_nodo_individual(self, superficie, nodo, posiciones, orden_recorrido, resaltar=False):
+        """Dibuja un nodo individual; sin resaltar, durante una animación se ve como no visitado"""
         if nodo not in posiciones:
             return
         
@@ -183,12 +230,12 @@ class VisualizadorArbolAVL:
         
         # Determinar color según estado de animación
         if self.animacion_activa:
-            if nodo == self.nodo_actual:
+            if resaltar and nodo == self.nodo_actual:
                 # Nodo actual en animación - amarillo brillante
                 color_nodo = self.AMARILLO
                 borde_color = self.ROJO
                 borde_grosor = 4
-            elif nodo in self.nodos_visitados:
+            elif resaltar and nodo in self.nodos_visitados:
                 # Nodo ya visitado - verde claro
                 color_nodo = self.VERDE_CLARO
                 borde_color = self.VERDE
@@ -206,41 +253,48 @@ class VisualizadorArbolAVL:
             borde_grosor = 2
         
         # Dibujar círculo del nodo
-        pygame.draw.circle(self.superficie, color_nodo, (int(x), int(y)), self.radio_nodo)
-        pygame.draw.circle(self.superficie, borde_color, (int(x), int(y)), self.radio_nodo, borde_grosor)
+        radio = self.radio_en_vista
+        pygame.draw.circle(superficie, color_nodo, (int(x), int(y)), radio)
+        pygame.draw.circle(superficie, borde_color, (int(x), int(y)), radio, min(borde_grosor, radio))
+        
+        # Con poco zoom los textos no caben en el nodo
+        if not self.etiquetas_en_vista:
+            return
         
         # Dibujar coordenadas
         texto_coords = f"({nodo.x},{nodo.y})"
-        superficie_coords = self.fuente_pequeña.render(texto_coords, True, self.BLANCO)
+        superficie_coords = self.cache_textos.renderizar(self.fuente_pequeña, texto_coords, self.BLANCO)
         rect_coords = superficie_coords.get_rect(center=(x, y - 5))
-        self.superficie.blit(superficie_coords, rect_coords)
+        superficie.blit(superficie_coords, rect_coords)
         
         # Dibujar tipo de obstáculo
-        superficie_tipo = self.fuente_pequeña.render(nodo.tipo[:4], True, self.BLANCO)
+        superficie_tipo = self.cache_textos.renderizar(self.fuente_pequeña, nodo.tipo[:4], self.BLANCO)
         rect_tipo = superficie_tipo.get_rect(center=(x, y + 8))
-        self.superficie.blit(superficie_tipo, rect_tipo)
+        superficie.blit(superficie_tipo, rect_tipo)
         
         # Dibujar orden en recorrido si se especifica
         if nodo in orden_recorrido:
             orden = str(orden_recorrido[nodo])
-            superficie_orden = self.fuente_pequeña.render(orden, True, self.ROJO)
-            rect_orden = superficie_orden.get_rect(center=(x + self.radio_nodo - 5, y - self.radio_nodo + 5))
-            pygame.draw.circle(self.superficie, self.BLANCO, rect_orden.center, 8)
-            pygame.draw.circle(self.superficie, self.ROJO, rect_orden.center, 8, 1)
-            self.superficie.blit(superficie_orden, rect_orden)
-        
-        # Dibujar altura y factor de balance
+            superficie_orden = self.cache_textos.renderizar(self.fuente_pequeña, orden, self.ROJO)
+            rect_orden = superficie_orden.get_rect(center=(x + radio - 5, y - radio + 5))
+            pygame.draw.circle(superficie, self.BLANCO, rect_orden.center, 8)
+            pygame.draw.circle(superficie, self.ROJO, rect_orden.center, 8, 1)
+            superficie.blit(superficie_orden, rect_orden)
+        
+        # Dibujar altura y factor de balance; queda fuera del círculo, así que la capa ya la tiene
+        if resaltar:
+            return
         altura_balance = f"h:{nodo.altura} b:{nodo.obtener_factor_balance()}"
-        superficie_info = self.fuente_pequeña.render(altura_balance, True, self.NEGRO)
-        rect_info = superficie_info.get_rect(center=(x, y + self.radio_nodo + 15))
-        self.superficie.blit(superficie_info, rect_info)
+        superficie_info = self.cache_textos.renderizar(self.fuente_pequeña, altura_balance, self.NEGRO)
+        rect_info = superficie_info.get_rect(center=(x, y + radio + 15))
+        superficie.blit(superficie_info, rect_info)
     
     def _dibujar_info_arbol(self, arbol):
         """Dibuja información general del árbol"""
         info_y = 10
         
         # Título
-        titulo = self.fuente_titulo.render("Árbol AVL de Obstáculos", True, self.NEGRO)
+        titulo = self.cache_textos.renderizar(self.fuente_titulo, "Árbol AVL de Obstáculos", self.NEGRO)
         self.superficie.blit(titulo, (10, info_y))
         info_y += 35
         
@@ -252,7 +306,7 @@ class VisualizadorArbolAVL:
         ]
         
         for line in info_lines:
-            superficie_info = self.fuente_pequeña.render(line, True, self.NEGRO)
+            superficie_info = self.cache_textos.renderizar(self.fuente_pequeña, line, self.NEGRO)
             self.superficie.blit(superficie_info, (10, info_y))
             info_y += 20
     
@@ -262,7 +316,7 @@ class VisualizadorArbolAVL:
         y_inicio = self.alto - 180
         
         # Título de recorridos
-        titulo_recorridos = self.fuente_grande.render("Recorridos:", True, self.NEGRO)
+        titulo_recorridos = self.cache_textos.renderizar(self.fuente_grande, "Recorridos:", self.NEGRO)
         self.superficie.blit(titulo_recorridos, (x_inicio, y_inicio))
         y_inicio += 30
         
@@ -279,69 +333,34 @@ class VisualizadorArbolAVL:
             recorrido = arbol.obtener_recorrido(tipo)
             
             # Nombre del recorrido
-            superficie_nombre = self.fuente_pequeña.render(f"{nombres_recorrido[tipo]}:", True, color)
+            superficie_nombre = self.cache_textos.renderizar(self.fuente_pequeña, f"{nombres_recorrido[tipo]}:", color)
             self.superficie.blit(superficie_nombre, (x_inicio, y_inicio))
             
-            # Secuencia del recorrido
-            secuencia = " → ".join([f"({n.x},{n.y})" for n in recorrido])
+            # Secuencia del recorrido; basta armar lo que cabe antes de truncar
+            secuencia = self._secuencia_recorrido(recorrido)
             if len(secuencia) > 80:  # Truncar si es muy largo
                 secuencia = secuencia[:77] + "..."
             
-            superficie_secuencia = self.fuente_pequeña.render(secuencia, True, color)
+            superficie_secuencia = self.cache_textos.renderizar(self.fuente_pequeña, secuencia, color)
             self.superficie.blit(superficie_secuencia, (x_inicio + 120, y_inicio))
             
             y_inicio += 20
     
-    def _obtener_recorrido_inorden(self, nodo):
-        """Obtiene recorrido inorden"""
-        resultado = []
-        if nodo:
-            resultado.extend(self._obtener_recorrido_inorden(nodo.izquierdo))
-            resultado.append(nodo)
-            resultado.extend(self._obtener_recorrido_inorden(nodo.derecho))
-        return resultado
-    
-    def _obtener_recorrido_preorden(self, nodo):
-        """Obtiene recorrido preorden"""
-        resultado = []
-        if nodo:
-            resultado.append(nodo)
-            resultado.extend(self._obtener_recorrido_preorden(nodo.izquierdo))
-            resultado.extend(self._obtener_recorrido_preorden(nodo.derecho))
-        return resultado
-    
-    def _obtener_recorrido_postorden(self, nodo):
-        """Obtiene recorrido postorden"""
-        resultado = []
-        if nodo:
-            resultado.extend(self._obtener_recorrido_postorden(nodo.izquierdo))
-            resultado.extend(self._obtener_recorrido_postorden(nodo.derecho))
-            resultado.append(nodo)
-        return resultado
-    
-    def _obtener_recorrido_anchura(self, nodo):
-        """Obtiene recorrido en anchura"""
-        if not nodo:
-            return []
-        
-        from collections import deque
-        resultado = []
-        cola = deque([nodo])
-        
-        while cola:
-            actual = cola.popleft()
-            resultado.append(actual)
-            
-            if actual.izquierdo:
-                cola.append(actual.izquierdo)
-            if actual.derecho:
-                cola.append(actual.derecho)
-        
-        return resultado
+    def _secuencia_recorrido(self, recorrido):
+        """Une los nodos del recorrido hasta pasar de 80 caracteres; el resto se truncaría"""
+        partes = []
+        largo = 0
+        for n in recorrido:
+            parte = f"({n.x},{n.y})"
+            partes.append(parte)
+            largo += len(parte) + 3
+            if largo > 83:
+                break
+        return " → ".join(partes)
     
     def _dibujar_mensaje(self, mensaje, x, y):
         """Dibuja un mensaje centrado"""
-        superficie_mensaje = self.fuente_grande.render(mensaje, True, self.GRIS)
+        superficie_mensaje = self.cache_textos.renderizar(self.fuente_grande, mensaje, self.GRIS)
         rect_mensaje = superficie_mensaje.get_rect(center=(x, y))
         self.superficie.blit(superficie_mensaje, rect_mensaje)
     
@@ -354,7 +373,7 @@ class VisualizadorArbolAVL:
         self.paso_actual = 0
         self.tipo_recorrido_animacion = tipo_recorrido
         self.tiempo_ultimo_paso = pygame.time.get_ticks()
-        self.nodos_visitados = []
+        self.nodos_visitados = set()
         self.nodo_actual = None
         
         # Obtener secuencia del recorrido
@@ -368,7 +387,7 @@ class VisualizadorArbolAVL:
         """Detiene la animación actual"""
         self.animacion_activa = False
         self.paso_actual = 0
-        self.nodos_visitados = []
+        self.nodos_visitados = set()
         self.nodo_actual = None
         print("⏹️ Animación detenida")
     
@@ -384,7 +403,7 @@ class VisualizadorArbolAVL:
             if self.paso_actual < len(self.nodos_recorrido):
                 # Mover nodo anterior a visitados
                 if self.nodo_actual is not None:
-                    self.nodos_visitados.append(self.nodo_actual)
+                    self.nodos_visitados.add(self.nodo_actual)
                 
                 # Obtener siguiente nodo
                 self.nodo_actual = self.nodos_recorrido[self.paso_actual]
@@ -397,7 +416,7 @@ class VisualizadorArbolAVL:
             else:
                 # Animación completa
                 if self.nodo_actual is not None:
-                    self.nodos_visitados.append(self.nodo_actual)
+                    self.nodos_visitados.add(self.nodo_actual)
                     self.nodo_actual = None
                 
                 print(f"✅ Animación {self.tipo_recorrido_animacion.upper()} completada!")
@@ -418,6 +437,25 @@ class VisualizadorArbolAVL:
         """Verifica si hay una animación en curso"""
         return self.animacion_activa
     
+    def acercar(self, factor, punto):
+        """Multiplica el zoom por factor sin mover el punto (x, y) de la superficie"""
+        zoom = min(max(self.zoom * factor, self.ZOOM_MIN), self.ZOOM_MAX)
+        x, y = punto
+        self.vista_x = x - (x - self.vista_x) * zoom / self.zoom
+        self.vista_y = y - (y - self.vista_y) * zoom / self.zoom
+        self.zoom = zoom
+    
+    def desplazar(self, dx, dy):
+        """Mueve la vista en píxeles de la superficie"""
+        self.vista_x += dx
+        self.vista_y += dy
+    
+    def restablecer_vista(self):
+        """Vuelve al zoom y la posición iniciales"""
+        self.zoom = 1.0
+        self.vista_x = 0.0
+        self.vista_y = 0.0
+    
     def activar_modo_eliminacion(self):
         """Activa el modo de eliminación de nodos"""
         self.modo_eliminacion = True
@@ -438,18 +476,25 @@ class VisualizadorArbolAVL:
         if not self.modo_eliminacion:
             return False
         
-        # Calcular posiciones de todos los nodos
-        posiciones = self._calcular_posiciones(arbol.raiz)
+        posiciones = self._obtener_posiciones(arbol)
         
-        # Verificar si se hizo clic en algún nodo (usar radio más grande para facilitar selección)
+        # El clic pasa a coordenadas del árbol; el radio de selección se mide en pantalla
         radio_seleccion = 50  # Radio más grande para facilitar la selección
-        for nodo, (x, y) in posiciones.items():
-            distancia = math.sqrt((pos_mouse[0] - x)**2 + (pos_mouse[1] - y)**2)
-            if distancia <= radio_seleccion:
-                # Nodo encontrado, proceder con eliminación
-                return self.eliminar_nodo_seleccionado(nodo, arbol)
+        x = (pos_mouse[0] - self.vista_x) / self.zoom
+        y = (pos_mouse[1] - self.vista_y) / self.zoom
         
-        return False
+        # El más cercano entre los nodos dibujados uno por uno
+        nodo = self._obtener_rejilla(posiciones).mas_cercano(x, y, radio_seleccion / self.zoom, self.nodos_en_vista)
+        if nodo is None:
+            return False
+        return self.eliminar_nodo_seleccionado(nodo, arbol)
+    
+    def _obtener_rejilla(self, posiciones):
+        """Índice de clics de las posiciones; se rehace cuando se recalculan"""
+        guardada = self.rejilla_guardada
+        if guardada is None or guardada[0] is not posiciones:
+            guardada = self.rejilla_guardada = (posiciones, RejillaNodos(posiciones, self.espacio_vertical))
+        return guardada[1]
     
     def eliminar_nodo_seleccionado(self, nodo, arbol):
         """Elimina el nodo seleccionado del árbol"""
@@ -498,20 +543,20 @@ class VisualizadorArbolAVL:
         
         # Título de animación
         titulo = f"🎬 ANIMACIÓN: {self.tipo_recorrido_animacion.upper()}"
-        superficie_titulo = self.fuente_grande.render(titulo, True, self.ROJO)
+        superficie_titulo = self.cache_textos.renderizar(self.fuente_grande, titulo, self.ROJO)
         self.superficie.blit(superficie_titulo, (x_info, y_info))
         y_info += 25
         
         # Progreso
         progreso = f"Paso: {self.paso_actual} / {len(self.nodos_recorrido)}"
-        superficie_progreso = self.fuente_pequeña.render(progreso, True, self.NEGRO)
+        superficie_progreso = self.cache_textos.renderizar(self.fuente_pequeña, progreso, self.NEGRO)
         self.superficie.blit(superficie_progreso, (x_info, y_info))
         y_info += 20
         
         # Nodo actual
         if self.nodo_actual:
             nodo_info = f"Actual: ({self.nodo_actual.x},{self.nodo_actual.y}) - {self.nodo_actual.tipo}"
-            superficie_nodo = self.fuente_pequeña.render(nodo_info, True, self.NARANJA)
+            superficie_nodo = self.cache_textos.renderizar(self.fuente_pequeña, nodo_info, self.NARANJA)
             self.superficie.blit(superficie_nodo, (x_info, y_info))
         y_info += 20
         
@@ -523,7 +568,7 @@ class VisualizadorArbolAVL:
         ]
         
         for texto, color in leyenda:
-            superficie_leyenda = self.fuente_pequeña.render(texto, True, self.NEGRO)
+            superficie_leyenda = self.cache_textos.renderizar(self.fuente_pequeña, texto, self.NEGRO)
             self.superficie.blit(superficie_leyenda, (x_info, y_info))
             y_info += 15
     
@@ -536,13 +581,13 @@ class VisualizadorArbolAVL:
         if self.mensaje_eliminacion and pygame.time.get_ticks() - self.tiempo_mensaje < 3000:  # 3 segundos
             mensaje_x = 10
             mensaje_y = self.alto - 90
-            superficie_mensaje = self.fuente_pequeña.render(self.mensaje_eliminacion, True, self.ROJO if "❌" in self.mensaje_eliminacion else self.VERDE)
+            superficie_mensaje = self.cache_textos.renderizar(self.fuente_pequeña, self.mensaje_eliminacion, self.ROJO if "❌" in self.mensaje_eliminacion else self.VERDE)
             self.superficie.blit(superficie_mensaje, (mensaje_x, mensaje_y))
         
         # Mostrar instrucciones en modo eliminación
         if self.modo_eliminacion:
             instruccion_x = 10
             instruccion_y = self.alto - 60
-            superficie_instruccion = self.fuente_pequeña.render("�️ MODO ELIMINACIÓN: Haz clic en un nodo para eliminarlo (ESC para cancelar)", True, self.ROJO)
+            superficie_instruccion = self.cache_textos.renderizar(self.fuente_pequeña, "�️ MODO ELIMINACIÓN: Haz clic en un nodo para eliminarlo (ESC para cancelar)", self.ROJO)
             self.superficie.blit(superficie_instruccion, (instruccion_x, instruccion_y))
     
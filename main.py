@@ -21,9 +21,9 @@ def main():
                     running = False
             motor.manejar_eventos(event)
         
-        motor.actualizar()
+        # Paso fijo: la simulación avanza con el tiempo real transcurrido, no por cuadro
+        motor.avanzar(clock.tick(60))
         gui.renderizar(motor)
-        clock.tick(60)
     
     pygame.quit()
     sys.exit()